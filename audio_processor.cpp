@@ -171,6 +171,35 @@ int process_audio_segment(struct whisper_context* ctx, struct whisper_context* c
         const int n_segments_orig = whisper_full_n_segments(ctx);
         const int n_segments_trans = whisper_full_n_segments(ctx_translate);
 
+        // Translation segment bounds and confidences don't depend on the original
+        // segment being matched, so read them once instead of once per original segment
+        struct TranslatedSegment {
+            int64_t t0;
+            int64_t t1;
+            const char* text;
+            bool has_tokens;
+            float confidence;
+        };
+        std::vector<TranslatedSegment> trans_segments;
+        trans_segments.reserve(n_segments_trans);
+        for (int j = 0; j < n_segments_trans; ++j) {
+            TranslatedSegment trans;
+            trans.t0 = whisper_full_get_segment_t0(ctx_translate, j);
+            trans.t1 = whisper_full_get_segment_t1(ctx_translate, j);
+            trans.text = whisper_full_get_segment_text(ctx_translate, j);
+            trans.confidence = 0.0f;
+            int trans_token_count = whisper_full_n_tokens(ctx_translate, j);
+            trans.has_tokens = trans_token_count > 0;
+            if (trans.has_tokens) {
+                for (int k = 0; k < trans_token_count; ++k) {
+                    trans.confidence += whisper_full_get_token_p(ctx_translate, j, k);
+                }
+                trans.confidence /= trans_token_count;
+            }
+            trans_segments.push_back(trans);
+        }
+
+        bilingual_results.reserve(n_segments_orig);
         for (int i = 0; i < n_segments_orig; ++i) {
             BilingualSegment seg;
             seg.t0 = whisper_full_get_segment_t0(ctx, i);
@@ -190,42 +219,52 @@ int process_audio_segment(struct whisper_context* ctx, struct whisper_context* c
             // Find matching translation segment (approximate timestamp matching)
             seg.english_text = "";
             seg.english_confidence = 0.0f;
-            for (int j = 0; j < n_segments_trans; ++j) {
-                int64_t trans_t0 = whisper_full_get_segment_t0(ctx_translate, j);
-                int64_t trans_t1 = whisper_full_get_segment_t1(ctx_translate, j);
-
+            for (const auto& trans : trans_segments) {
                 // Check for overlap (allow some tolerance)
-                int64_t overlap_start = std::max(seg.t0, trans_t0);
-                int64_t overlap_end = std::min(seg.t1, trans_t1);
+                int64_t overlap_start = std::max(seg.t0, trans.t0);
+                int64_t overlap_end = std::min(seg.t1, trans.t1);
                 if (overlap_end > overlap_start) {
                     // Found overlapping segment
                     if (seg.english_text.empty()) {
-                        seg.english_text = whisper_full_get_segment_text(ctx_translate, j);
+                        seg.english_text = trans.text;
                     } else {
-                        seg.english_text += " " + std::string(whisper_full_get_segment_text(ctx_translate, j));
+                        seg.english_text += " ";
+                        seg.english_text += trans.text;
                     }
 
                     // Update confidence (average)
-                    int trans_token_count = whisper_full_n_tokens(ctx_translate, j);
-                    if (trans_token_count > 0) {
-                        float trans_confidence = 0.0f;
-                        for (int k = 0; k < trans_token_count; ++k) {
-                            trans_confidence += whisper_full_get_token_p(ctx_translate, j, k);
-                        }
-                        trans_confidence /= trans_token_count;
-                        seg.english_confidence = (seg.english_confidence + trans_confidence) / 2.0f;
+                    if (trans.has_tokens) {
+                        seg.english_confidence = (seg.english_confidence + trans.confidence) / 2.0f;
                     }
                 }
             }
 
             seg.speaker_turn = whisper_full_get_segment_speaker_turn_next(ctx, i);
-            bilingual_results.push_back(seg);
+            bilingual_results.push_back(std::move(seg));
         }
     }
 
     return 0;
 }
 
+void filter_segment_hallucinations(std::vector<BilingualSegment>& segments) {
+    for (auto& seg : segments) {
+        if (!seg.original_text.empty()) {
+            seg.original_text = filter_hallucinations(seg.original_text);
+        }
+        if (!seg.english_text.empty()) {
+            seg.english_text = filter_hallucinations(seg.english_text);
+        }
+    }
+    // Remove segments where both texts became empty after filtering
+    segments.erase(
+        std::remove_if(segments.begin(), segments.end(),
+            [](const BilingualSegment& s) {
+                return s.original_text.empty() && s.english_text.empty();
+            }),
+        segments.end());
+}
+
 // Print tokens with confidence-based colors
 void print_colored_tokens(whisper_context * ctx, int i_segment, const whisper_params& params) {
     for (int j = 0; j < whisper_full_n_tokens(ctx, i_segment); ++j) {
@@ -266,9 +305,11 @@ bool should_auto_copy(const AutoCopySession& session, const whisper_params& para
         return false;
     }
 
-    // Check content size
-    std::string content = session.transcription_buffer.str();
-    if (content.size() > static_cast<size_t>(params.auto_copy_max_size_bytes)) {
+    // Check content size. This runs for every printed segment, so read the
+    // put position instead of copying the whole buffer out with str().
+    std::streamoff content_size = session.transcription_buffer.rdbuf()->pubseekoff(
+        0, std::ios_base::cur, std::ios_base::out);
+    if (content_size > static_cast<std::streamoff>(params.auto_copy_max_size_bytes)) {
         return false;
     }
 
@@ -288,6 +329,12 @@ void print_bilingual_results(const std::vector<BilingualSegment>& segments, cons
         if (pipe_buffer) { *pipe_buffer << text; }
     };
 
+    // Per-call invariants, resolved once rather than for every segment
+    const bool mode_original = params.output_mode == "original";
+    const bool mode_english = params.output_mode == "english";
+    const bool mode_bilingual = params.output_mode == "bilingual";
+    const std::string lang_code = params.language == "auto" ? "orig" : params.language;
+
     for (const auto& seg : segments) {
         // Track speaker IDs via shared tracker
         int seg_speaker_id = speaker_tracker.get_current();
@@ -296,7 +343,7 @@ void print_bilingual_results(const std::vector<BilingualSegment>& segments, cons
         }
         if (params.no_timestamps) {
             // Plain text mode
-            if (params.output_mode == "original") {
+            if (mode_original) {
                 out(seg.original_text);
 
                 if (accumulate) {
@@ -322,7 +369,7 @@ void print_bilingual_results(const std::vector<BilingualSegment>& segments, cons
                     }
                 }
             }
-            else if (params.output_mode == "english") {
+            else if (mode_english) {
                 out(seg.english_text);
 
                 if (accumulate) {
@@ -348,11 +395,7 @@ void print_bilingual_results(const std::vector<BilingualSegment>& segments, cons
                     }
                 }
             }
-            else if (params.output_mode == "bilingual") {
-                // Detect language for prefixes
-                std::string lang_code = params.language;
-                if (lang_code == "auto") lang_code = "orig";
-
+            else if (mode_bilingual) {
                 out(lang_code + ": " + seg.original_text + "\n");
                 out("en: " + seg.english_text + "\n");
 
@@ -389,7 +432,7 @@ void print_bilingual_results(const std::vector<BilingualSegment>& segments, cons
             // Timestamped mode
             std::string timestamp_prefix = "[" + to_timestamp(seg.t0, false) + " --> " + to_timestamp(seg.t1, false) + "]  ";
 
-            if (params.output_mode == "original") {
+            if (mode_original) {
                 out(timestamp_prefix + seg.original_text);
                 if (seg.speaker_turn) out(" [SPEAKER_TURN]");
                 out("\n");
@@ -421,7 +464,7 @@ void print_bilingual_results(const std::vector<BilingualSegment>& segments, cons
                     }
                 }
             }
-            else if (params.output_mode == "english") {
+            else if (mode_english) {
                 out(timestamp_prefix + seg.english_text);
                 if (seg.speaker_turn) out(" [SPEAKER_TURN]");
                 out("\n");
@@ -453,11 +496,7 @@ void print_bilingual_results(const std::vector<BilingualSegment>& segments, cons
                     }
                 }
             }
-            else if (params.output_mode == "bilingual") {
-                // Detect language for prefixes
-                std::string lang_code = params.language;
-                if (lang_code == "auto") lang_code = "orig";
-
+            else if (mode_bilingual) {
                 out(timestamp_prefix + lang_code + ": " + seg.original_text + "\n");
                 out(timestamp_prefix + "en: " + seg.english_text);
                 if (seg.speaker_turn) out(" [SPEAKER_TURN]");
@@ -495,7 +534,8 @@ void print_bilingual_results(const std::vector<BilingualSegment>& segments, cons
                 }
             }
         }
-
-        fflush(stdout);
     }
+
+    // All segments are already decoded, so one flush shows them together
+    fflush(stdout);
 }
@@ -31,6 +31,9 @@ int process_audio_segment(struct whisper_context* ctx, struct whisper_context* c
                           std::vector<BilingualSegment>& bilingual_results,
                           const std::vector<whisper_token>& prompt_tokens = {});
 
+// Apply the hallucination filter to every segment and drop segments left with no text
+void filter_segment_hallucinations(std::vector<BilingualSegment>& segments);
+
 // Print tokens with confidence-based colors
 void print_colored_tokens(whisper_context* ctx, int i_segment, const whisper_params& params);
 
@@ -117,59 +117,7 @@ bool whisper_params_parse(int argc, char ** argv, whisper_params & params) {
         else if (arg == "--no-history")                       { params.history_enabled = false; }
         // Config management options
         else if (arg == "config") {
-            if (i + 1 < argc) {
-                std::string config_cmd = argv[++i];
-                ConfigManager config_manager;
-                config_manager.load_config();
-
-                if (config_cmd == "list") {
-                    config_manager.list_config();
-                    exit(0);
-                } else if (config_cmd == "set" && i + 2 < argc) {
-                    std::string key = argv[++i];
-                    std::string value = argv[++i];
-                    if (config_manager.set_config(key, value)) {
-                        config_manager.save_user_config();
-                        std::cout << "Set " << key << " = " << value << std::endl;
-                        exit(0);
-                    } else {
-                        std::cerr << "Failed to set config: " << key << std::endl;
-                        exit(1);
-                    }
-                } else if (config_cmd == "get" && i + 1 < argc) {
-                    std::string key = argv[++i];
-                    auto value = config_manager.get_config(key);
-                    if (value) {
-                        std::cout << key << " = " << *value << std::endl;
-                    } else {
-                        std::cout << key << " is not set" << std::endl;
-                    }
-                    exit(0);
-                } else if (config_cmd == "unset" && i + 1 < argc) {
-                    std::string key = argv[++i];
-                    if (config_manager.unset_config(key)) {
-                        config_manager.save_user_config();
-                        std::cout << "Unset " << key << std::endl;
-                        exit(0);
-                    } else {
-                        std::cerr << "Failed to unset config: " << key << std::endl;
-                        exit(1);
-                    }
-                } else if (config_cmd == "reset") {
-                    config_manager.reset_config();
-                    config_manager.save_user_config();
-                    std::cout << "Configuration reset to defaults" << std::endl;
-                    exit(0);
-                } else {
-                    std::cerr << "Unknown config command: " << config_cmd << std::endl;
-                    std::cerr << "Available commands: list, set <key> <value>, get <key>, unset <key>, reset" << std::endl;
-                    exit(1);
-                }
-            } else {
-                std::cerr << "Config command requires a subcommand" << std::endl;
-                std::cerr << "Available commands: list, set <key> <value>, get <key>, unset <key>, reset" << std::endl;
-                exit(1);
-            }
+            exit(handle_config_command(argc - i - 1, argv + i + 1));
         }
         else if (arg == "--no-timestamps")                   { params.no_timestamps = true; }
 
@@ -336,6 +284,62 @@ int handle_model_commands(const whisper_params& params, ModelManager& model_mana
     return -1; // No command matched
 }
 
+int handle_config_command(int argc, char** argv) {
+    if (argc < 1) {
+        std::cerr << "Config command requires a subcommand" << std::endl;
+        std::cerr << "Available commands: list, set <key> <value>, get <key>, unset <key>, reset" << std::endl;
+        return 1;
+    }
+
+    std::string config_cmd = argv[0];
+    ConfigManager config_manager;
+    config_manager.load_config();
+
+    if (config_cmd == "list") {
+        config_manager.list_config();
+        return 0;
+    } else if (config_cmd == "set" && argc >= 3) {
+        std::string key = argv[1];
+        std::string value = argv[2];
+        if (config_manager.set_config(key, value)) {
+            config_manager.save_user_config();
+            std::cout << "Set " << key << " = " << value << std::endl;
+            return 0;
+        } else {
+            std::cerr << "Failed to set config: " << key << std::endl;
+            return 1;
+        }
+    } else if (config_cmd == "get" && argc >= 2) {
+        std::string key = argv[1];
+        auto value = config_manager.get_config(key);
+        if (value) {
+            std::cout << key << " = " << *value << std::endl;
+        } else {
+            std::cout << key << " is not set" << std::endl;
+        }
+        return 0;
+    } else if (config_cmd == "unset" && argc >= 2) {
+        std::string key = argv[1];
+        if (config_manager.unset_config(key)) {
+            config_manager.save_user_config();
+            std::cout << "Unset " << key << std::endl;
+            return 0;
+        } else {
+            std::cerr << "Failed to unset config: " << key << std::endl;
+            return 1;
+        }
+    } else if (config_cmd == "reset") {
+        config_manager.reset_config();
+        config_manager.save_user_config();
+        std::cout << "Configuration reset to defaults" << std::endl;
+        return 0;
+    } else {
+        std::cerr << "Unknown config command: " << config_cmd << std::endl;
+        std::cerr << "Available commands: list, set <key> <value>, get <key>, unset <key>, reset" << std::endl;
+        return 1;
+    }
+}
+
 int handle_history_command(int argc, char** argv) {
     std::string subcmd = (argc >= 1) ? argv[0] : "list";
     bool json_output = false;
@@ -15,5 +15,8 @@ void whisper_print_usage(int argc, char** argv, const whisper_params& params);
 // Returns: -1 if no command matched (continue to main flow), 0+ for exit code
 int handle_model_commands(const whisper_params& params, ModelManager& model_manager);
 
+// Handle "recognize config ..." subcommand
+int handle_config_command(int argc, char** argv);
+
 // Handle "recognize history ..." subcommand
 int handle_history_command(int argc, char** argv);
@@ -4,8 +4,15 @@
 #include <filesystem>
 #include <cstdlib>
 #include <sstream>
+#include <stdexcept>
 #include <iomanip>
 #include <algorithm>
+#include <cstring>
+#include <sys/stat.h>
+#include <type_traits>
+#include <variant>
+
+extern char** environ;
 
 // Simple JSON handling without external dependencies
 namespace {
@@ -49,39 +56,140 @@ namespace {
         return unescaped;
     }
     
-    // Extract JSON value (simple parser for our use case)
-    std::string extract_json_value(const std::string& json, const std::string& key) {
-        std::string search = "\"" + key + "\"";
-        size_t pos = json.find(search);
-        if (pos == std::string::npos) return "";
-        
-        pos = json.find(':', pos);
-        if (pos == std::string::npos) return "";
-        
-        // Skip whitespace
+    // Read a JSON string starting at the opening quote; pos ends past the closing quote
+    std::string read_json_string(const std::string& json, size_t& pos) {
+        size_t start = ++pos;
+        while (pos < json.length() && json[pos] != '"') {
+            pos += (json[pos] == '\\') ? 2 : 1;
+        }
+        std::string raw = json.substr(start, std::min(pos, json.length()) - start);
         ++pos;
-        while (pos < json.length() && std::isspace(json[pos])) ++pos;
-        
-        if (pos >= json.length()) return "";
-        
-        if (json[pos] == '"') {
-            // String value
+        return unescape_json_string(raw);
+    }
+
+    // Parse a flat JSON object (simple parser for our use case) into key -> value
+    // in one pass. String values are unescaped; other values are kept as trimmed text.
+    std::map<std::string, std::string> parse_json_object(const std::string& json) {
+        std::map<std::string, std::string> values;
+        size_t pos = json.find('{');
+        if (pos == std::string::npos) return values;
+        ++pos;
+
+        auto skip_space = [&]() {
+            while (pos < json.length() && std::isspace(static_cast<unsigned char>(json[pos]))) ++pos;
+        };
+
+        while (true) {
+            skip_space();
+            if (pos >= json.length() || json[pos] != '"') break;
+            std::string key = read_json_string(json, pos);
+
+            skip_space();
+            if (pos >= json.length() || json[pos] != ':') break;
             ++pos;
-            size_t end = json.find('"', pos);
-            if (end == std::string::npos) return "";
-            return unescape_json_string(json.substr(pos, end - pos));
-        } else {
-            // Non-string value (number, boolean, null)
-            size_t end = pos;
-            while (end < json.length() && json[end] != ',' && json[end] != '}' && json[end] != ']') {
-                ++end;
+            skip_space();
+            if (pos >= json.length()) break;
+
+            std::string value;
+            if (json[pos] == '"') {
+                value = read_json_string(json, pos);
+            } else {
+                // Non-string value (number, boolean, null); nested values are skipped whole
+                size_t start = pos;
+                int depth = 0;
+                while (pos < json.length()) {
+                    char c = json[pos];
+                    if (c == '{' || c == '[') ++depth;
+                    else if ((c == '}' || c == ']') && depth > 0) --depth;
+                    else if (depth == 0 && (c == ',' || c == '}' || c == ']')) break;
+                    ++pos;
+                }
+                value = json.substr(start, pos - start);
+                value.erase(value.find_last_not_of(" \t\n\r") + 1);
             }
-            std::string value = json.substr(pos, end - pos);
-            // Trim whitespace
-            value.erase(0, value.find_first_not_of(" \t\n\r"));
-            value.erase(value.find_last_not_of(" \t\n\r") + 1);
-            return value;
+            values.emplace(std::move(key), std::move(value)); // First occurrence wins
+
+            skip_space();
+            if (pos >= json.length() || json[pos] != ',') break;
+            ++pos;
+        }
+        return values;
+    }
+
+    // Shared boolean parser for config values and environment variables
+    std::optional<bool> parse_bool(const std::string& value) {
+        std::string lower = value;
+        std::transform(lower.begin(), lower.end(), lower.begin(), ::tolower);
+        if (lower == "true" || lower == "1" || lower == "yes" || lower == "on") return true;
+        if (lower == "false" || lower == "0" || lower == "no" || lower == "off") return false;
+        return std::nullopt;
+    }
+
+    // Canonical config keys mapped to their ConfigData fields, shared by set/get/unset
+    using ConfigField = std::variant<
+        std::optional<std::string> ConfigData::*,
+        std::optional<bool> ConfigData::*,
+        std::optional<int> ConfigData::*,
+        std::optional<float> ConfigData::*>;
+
+    const std::map<std::string, ConfigField>& config_fields() {
+        static const std::map<std::string, ConfigField> fields = {
+            {"default_model", &ConfigData::default_model},
+            {"models_directory", &ConfigData::models_directory},
+            {"use_coreml", &ConfigData::use_coreml},
+            {"coreml_no_ane", &ConfigData::coreml_no_ane},
+            {"coreml_model", &ConfigData::coreml_model},
+            {"capture_device", &ConfigData::capture_device},
+            {"step_ms", &ConfigData::step_ms},
+            {"length_ms", &ConfigData::length_ms},
+            {"keep_ms", &ConfigData::keep_ms},
+            {"vad_threshold", &ConfigData::vad_threshold},
+            {"freq_threshold", &ConfigData::freq_threshold},
+            {"threads", &ConfigData::threads},
+            {"max_tokens", &ConfigData::max_tokens},
+            {"beam_size", &ConfigData::beam_size},
+            {"language", &ConfigData::language},
+            {"translate", &ConfigData::translate},
+            {"no_timestamps", &ConfigData::no_timestamps},
+            {"print_special", &ConfigData::print_special},
+            {"print_colors", &ConfigData::print_colors},
+            {"save_audio", &ConfigData::save_audio},
+            {"tinydiarize", &ConfigData::tinydiarize},
+            {"output_file", &ConfigData::output_file},
+            {"output_format", &ConfigData::output_format},
+            {"output_mode", &ConfigData::output_mode},
+            {"auto_copy_enabled", &ConfigData::auto_copy_enabled},
+            {"auto_copy_max_duration_hours", &ConfigData::auto_copy_max_duration_hours},
+            {"auto_copy_max_size_bytes", &ConfigData::auto_copy_max_size_bytes},
+            {"meeting_mode", &ConfigData::meeting_mode},
+            {"meeting_prompt", &ConfigData::meeting_prompt},
+            {"meeting_name", &ConfigData::meeting_name},
+            {"meeting_initial_prompt", &ConfigData::meeting_initial_prompt},
+            {"meeting_timeout", &ConfigData::meeting_timeout},
+            {"meeting_max_single_pass", &ConfigData::meeting_max_single_pass},
+            {"silence_timeout", &ConfigData::silence_timeout},
+            {"ptt_mode", &ConfigData::ptt_mode},
+            {"ptt_key", &ConfigData::ptt_key},
+            {"refine", &ConfigData::refine},
+            {"history_enabled", &ConfigData::history_enabled},
+            {"entropy_thold", &ConfigData::entropy_thold},
+            {"logprob_thold", &ConfigData::logprob_thold},
+            {"no_speech_thold", &ConfigData::no_speech_thold},
+            {"length_penalty", &ConfigData::length_penalty},
+            {"best_of", &ConfigData::best_of},
+            {"suppress_nst", &ConfigData::suppress_nst},
+            {"carry_initial_prompt", &ConfigData::carry_initial_prompt},
+            {"normalize_audio", &ConfigData::normalize_audio}
+        };
+        return fields;
+    }
+
+    // One pass over the environment instead of ~50 getenv() misses
+    bool has_whisper_env_vars() {
+        for (char** env = environ; env && *env; ++env) {
+            if (std::strncmp(*env, "WHISPER_", 8) == 0) return true;
         }
+        return false;
     }
 }
 
@@ -92,29 +200,32 @@ ConfigManager::ConfigManager() {
 void ConfigManager::init_config_paths() {
     // User config: ~/.recognize/config.json
     const char* home = getenv("HOME");
+    // The directory is created on first save, not on every construction
     if (home) {
-        std::string config_dir = std::string(home) + "/.recognize";
-        std::filesystem::create_directories(config_dir);
-        user_config_path_ = config_dir + "/config.json";
+        user_config_path_ = std::string(home) + "/.recognize/config.json";
     }
     
     // Project config: ./config.json or ./.whisper-config.json
+    project_config_found_ = true;
     if (std::filesystem::exists(".whisper-config.json")) {
         project_config_path_ = ".whisper-config.json";
     } else if (std::filesystem::exists("config.json")) {
         project_config_path_ = "config.json";
     } else {
         project_config_path_ = ".whisper-config.json"; // Default for new files
+        project_config_found_ = false;
     }
 }
 
 void ConfigManager::load_config() {
-    // Load in priority order: user config, project config, environment
-    if (!user_config_path_.empty() && std::filesystem::exists(user_config_path_)) {
+    // Load in priority order: user config, project config, environment.
+    // load_config_file() stats the path itself and returns empty when missing.
+    if (!user_config_path_.empty()) {
         user_config_ = load_config_file(user_config_path_);
     }
     
-    if (std::filesystem::exists(project_config_path_)) {
+    // Both candidates were already probed in init_config_paths()
+    if (project_config_found_) {
         project_config_ = load_config_file(project_config_path_);
     }
     
@@ -122,7 +233,7 @@ void ConfigManager::load_config() {
 }
 
 void ConfigManager::apply_to_params(whisper_params& params) const {
-    ConfigData effective = get_effective_config();
+    const ConfigData& effective = get_effective_config();
     
     if (effective.default_model) params.model = *effective.default_model;
     if (effective.use_coreml) params.use_coreml = *effective.use_coreml;
@@ -181,135 +292,97 @@ void ConfigManager::apply_to_params(whisper_params& params) const {
 }
 
 const std::map<std::string, std::string>& ConfigManager::get_config_key_map() const {
-    static const std::map<std::string, std::string> key_map = {
-        {"model", "default_model"},
-        {"default_model", "default_model"},
-        {"models_dir", "models_directory"},
-        {"models_directory", "models_directory"},
-        {"coreml", "use_coreml"},
-        {"use_coreml", "use_coreml"},
-        {"coreml_no_ane", "coreml_no_ane"},
-        {"coreml_gpu_only", "coreml_no_ane"},
-        {"no_ane", "coreml_no_ane"},
-        {"coreml_model", "coreml_model"},
-        {"capture", "capture_device"},
-        {"capture_device", "capture_device"},
-        {"step", "step_ms"},
-        {"step_ms", "step_ms"},
-        {"length", "length_ms"},
-        {"length_ms", "length_ms"},
-        {"keep", "keep_ms"},
-        {"keep_ms", "keep_ms"},
-        {"vad", "vad_threshold"},
-        {"vad_threshold", "vad_threshold"},
-        {"freq", "freq_threshold"},
-        {"freq_threshold", "freq_threshold"},
-        {"threads", "threads"},
-        {"tokens", "max_tokens"},
-        {"max_tokens", "max_tokens"},
-        {"beam", "beam_size"},
-        {"beam_size", "beam_size"},
-        {"language", "language"},
-        {"lang", "language"},
-        {"translate", "translate"},
-        {"timestamps", "no_timestamps"},
-        {"no_timestamps", "no_timestamps"},
-        {"special", "print_special"},
-        {"print_special", "print_special"},
-        {"colors", "print_colors"},
-        {"print_colors", "print_colors"},
-        {"save_audio", "save_audio"},
-        {"tinydiarize", "tinydiarize"},
-        {"speaker_segmentation", "tinydiarize"},
-        {"output", "output_file"},
-        {"output_file", "output_file"},
-        {"format", "output_format"},
-        {"output_format", "output_format"},
-        {"mode", "output_mode"},
-        {"output_mode", "output_mode"},
-        
-        // Auto-copy configuration keys
-        {"auto_copy", "auto_copy_enabled"},
-        {"auto_copy_enabled", "auto_copy_enabled"},
-        {"auto_copy_max_duration", "auto_copy_max_duration_hours"},
-        {"auto_copy_max_duration_hours", "auto_copy_max_duration_hours"},
-        {"auto_copy_max_size", "auto_copy_max_size_bytes"},
-        {"auto_copy_max_size_bytes", "auto_copy_max_size_bytes"},
-
-        // Meeting configuration keys
-        {"meeting", "meeting_mode"},
-        {"meeting_mode", "meeting_mode"},
-        {"meeting_prompt", "meeting_prompt"},
-        {"meeting_name", "meeting_name"},
-        {"meeting_initial_prompt", "meeting_initial_prompt"},
-        {"meeting_timeout", "meeting_timeout"},
-        {"meeting_max_single_pass", "meeting_max_single_pass"},
-        {"silence_timeout", "silence_timeout"},
-
-        // Push-to-talk configuration keys
-        {"ptt", "ptt_mode"},
-        {"ptt_mode", "ptt_mode"},
-        {"ptt_key", "ptt_key"},
-
-        // Refinement configuration keys
-        {"refine", "refine"},
-
-        // History configuration keys
-        {"history", "history_enabled"},
-        {"history_enabled", "history_enabled"},
-
-        // Accuracy configuration keys
-        {"entropy", "entropy_thold"},
-        {"entropy_thold", "entropy_thold"},
-        {"logprob", "logprob_thold"},
-        {"logprob_thold", "logprob_thold"},
-        {"no_speech", "no_speech_thold"},
-        {"no_speech_thold", "no_speech_thold"},
-        {"length_penalty", "length_penalty"},
-        {"best_of", "best_of"},
-        {"suppress_nst", "suppress_nst"},
-        {"carry_prompt", "carry_initial_prompt"},
-        {"carry_initial_prompt", "carry_initial_prompt"},
-        {"normalize", "normalize_audio"},
-        {"normalize_audio", "normalize_audio"}
-    };
+    // Every canonical field name in config_fields() is accepted as-is; this
+    // table only adds the short aliases, so each field is listed in one place.
+    static const std::map<std::string, std::string> key_map = [] {
+        std::map<std::string, std::string> keys = {
+            {"model", "default_model"},
+            {"models_dir", "models_directory"},
+            {"coreml", "use_coreml"},
+            {"coreml_gpu_only", "coreml_no_ane"},
+            {"no_ane", "coreml_no_ane"},
+            {"capture", "capture_device"},
+            {"step", "step_ms"},
+            {"length", "length_ms"},
+            {"keep", "keep_ms"},
+            {"vad", "vad_threshold"},
+            {"freq", "freq_threshold"},
+            {"tokens", "max_tokens"},
+            {"beam", "beam_size"},
+            {"lang", "language"},
+            {"timestamps", "no_timestamps"},
+            {"special", "print_special"},
+            {"colors", "print_colors"},
+            {"speaker_segmentation", "tinydiarize"},
+            {"output", "output_file"},
+            {"format", "output_format"},
+            {"mode", "output_mode"},
+
+            // Auto-copy configuration keys
+            {"auto_copy", "auto_copy_enabled"},
+            {"auto_copy_max_duration", "auto_copy_max_duration_hours"},
+            {"auto_copy_max_size", "auto_copy_max_size_bytes"},
+
+            // Meeting configuration keys
+            {"meeting", "meeting_mode"},
+
+            // Push-to-talk configuration keys
+            {"ptt", "ptt_mode"},
+
+            // History configuration keys
+            {"history", "history_enabled"},
+
+            // Accuracy configuration keys
+            {"entropy", "entropy_thold"},
+            {"logprob", "logprob_thold"},
+            {"no_speech", "no_speech_thold"},
+            {"carry_prompt", "carry_initial_prompt"},
+            {"normalize", "normalize_audio"}
+        };
+        for (const auto& field : config_fields()) {
+            keys.emplace(field.first, field.first);
+        }
+        return keys;
+    }();
     return key_map;
 }
 
 bool ConfigManager::set_config(const std::string& key, const std::string& value) {
-    auto key_map = get_config_key_map();
+    const auto& key_map = get_config_key_map();
     auto it = key_map.find(key);
     if (it == key_map.end()) {
         std::cerr << "Unknown config key: " << key << std::endl;
         return false;
     }
     
+    effective_cache_.reset();
     return set_config_value(user_config_, it->second, value);
 }
 
 std::optional<std::string> ConfigManager::get_config(const std::string& key) const {
-    auto key_map = get_config_key_map();
+    const auto& key_map = get_config_key_map();
     auto it = key_map.find(key);
     if (it == key_map.end()) {
         return std::nullopt;
     }
     
-    ConfigData effective = get_effective_config();
+    const ConfigData& effective = get_effective_config();
     return get_config_value(effective, it->second);
 }
 
 bool ConfigManager::unset_config(const std::string& key) {
-    auto key_map = get_config_key_map();
+    const auto& key_map = get_config_key_map();
     auto it = key_map.find(key);
     if (it == key_map.end()) {
         return false;
     }
     
+    effective_cache_.reset();
     return set_config_value(user_config_, it->second, ""); // Set to empty to unset
 }
 
 void ConfigManager::list_config() const {
-    ConfigData effective = get_effective_config();
+    const ConfigData& effective = get_effective_config();
     
     std::cout << "Current Configuration:\n";
     std::cout << "======================\n\n";
@@ -429,6 +502,7 @@ void ConfigManager::reset_config() {
     user_config_ = ConfigData{};
     project_config_ = ConfigData{};
     env_config_ = ConfigData{};
+    effective_cache_.reset();
 }
 
 bool ConfigManager::save_user_config() const {
@@ -437,10 +511,20 @@ bool ConfigManager::save_user_config() const {
 }
 
 bool ConfigManager::save_project_config() const {
-    return save_config_file(project_config_path_, project_config_);
+    if (!save_config_file(project_config_path_, project_config_)) {
+        return false;
+    }
+    // The file exists now, so a later load_config() in this process must read it
+    project_config_found_ = true;
+    effective_cache_.reset();
+    return true;
 }
 
 void ConfigManager::load_env_vars() {
+    env_config_ = ConfigData{};
+    effective_cache_.reset();
+    if (!has_whisper_env_vars()) return;
+
     env_config_.default_model = get_env_var("WHISPER_MODEL");
     env_config_.models_directory = get_env_var("WHISPER_MODELS_DIR");
     env_config_.use_coreml = get_env_bool("WHISPER_COREML");
@@ -499,7 +583,7 @@ void ConfigManager::load_env_vars() {
 }
 
 bool ConfigManager::validate_config() const {
-    ConfigData effective = get_effective_config();
+    const ConfigData& effective = get_effective_config();
     
     // Validate model if specified
     if (effective.default_model) {
@@ -525,16 +609,25 @@ bool ConfigManager::validate_config() const {
     return true;
 }
 
-ConfigData ConfigManager::get_effective_config() const {
-    return merge_configs({user_config_, project_config_, env_config_});
+const ConfigData& ConfigManager::get_effective_config() const {
+    if (!effective_cache_) {
+        effective_cache_ = merge_configs({&user_config_, &project_config_, &env_config_});
+    }
+    return *effective_cache_;
 }
 
 ConfigData ConfigManager::load_config_file(const std::string& filepath) const {
+    struct stat st;
+    if (::stat(filepath.c_str(), &st) != 0) return ConfigData{};
+
     std::ifstream file(filepath);
     if (!file) return ConfigData{};
     
-    std::string json_str((std::istreambuf_iterator<char>(file)),
-                         std::istreambuf_iterator<char>());
+    // stat() already gave the size, so read the file in one block instead of
+    // pulling it through an istreambuf_iterator a character at a time
+    std::string json_str(static_cast<size_t>(st.st_size), '\0');
+    file.read(&json_str[0], static_cast<std::streamsize>(json_str.size()));
+    json_str.resize(static_cast<size_t>(file.gcount()));
     
     return json_to_config(json_str);
 }
@@ -553,10 +646,12 @@ bool ConfigManager::save_config_file(const std::string& filepath, const ConfigDa
     return file.good();
 }
 
-ConfigData ConfigManager::merge_configs(const std::vector<ConfigData>& configs) const {
+ConfigData ConfigManager::merge_configs(std::initializer_list<const ConfigData*> configs) const {
     ConfigData merged;
     
-    for (const auto& config : configs) {
+    // Sources are walked by pointer, later ones overriding earlier ones
+    for (const ConfigData* source : configs) {
+        const ConfigData& config = *source;
         if (config.default_model) merged.default_model = config.default_model;
         if (config.models_directory) merged.models_directory = config.models_directory;
         if (config.use_coreml) merged.use_coreml = config.use_coreml;
@@ -710,35 +805,41 @@ std::string ConfigManager::config_to_json(const ConfigData& config) const {
 
 ConfigData ConfigManager::json_to_config(const std::string& json_str) const {
     ConfigData config;
+    const auto values = parse_json_object(json_str);
+    
+    auto get_raw = [&values](const std::string& key) -> std::string {
+        auto it = values.find(key);
+        return it != values.end() ? it->second : std::string();
+    };
     
     auto get_string = [&](const std::string& key) -> std::optional<std::string> {
-        std::string value = extract_json_value(json_str, key);
+        std::string value = get_raw(key);
         return value.empty() ? std::nullopt : std::make_optional(value);
     };
     
     auto get_bool = [&](const std::string& key) -> std::optional<bool> {
-        std::string value = extract_json_value(json_str, key);
+        std::string value = get_raw(key);
         if (value == "true") return true;
         if (value == "false") return false;
         return std::nullopt;
     };
     
     auto get_int = [&](const std::string& key) -> std::optional<int> {
-        std::string value = extract_json_value(json_str, key);
+        std::string value = get_raw(key);
         if (value.empty()) return std::nullopt;
         try {
             return std::stoi(value);
-        } catch (...) {
+        } catch (const std::exception&) {
             return std::nullopt;
         }
     };
     
     auto get_float = [&](const std::string& key) -> std::optional<float> {
-        std::string value = extract_json_value(json_str, key);
+        std::string value = get_raw(key);
         if (value.empty()) return std::nullopt;
         try {
             return std::stof(value);
-        } catch (...) {
+        } catch (const std::exception&) {
             return std::nullopt;
         }
     };
@@ -811,17 +912,7 @@ std::optional<std::string> ConfigManager::get_env_var(const std::string& name) c
 std::optional<bool> ConfigManager::get_env_bool(const std::string& name) const {
     auto value = get_env_var(name);
     if (!value) return std::nullopt;
-    
-    std::string lower = *value;
-    std::transform(lower.begin(), lower.end(), lower.begin(), ::tolower);
-    
-    if (lower == "true" || lower == "1" || lower == "yes" || lower == "on") {
-        return true;
-    } else if (lower == "false" || lower == "0" || lower == "no" || lower == "off") {
-        return false;
-    }
-    
-    return std::nullopt;
+    return parse_bool(*value);
 }
 
 std::optional<int> ConfigManager::get_env_int(const std::string& name) const {
@@ -830,7 +921,7 @@ std::optional<int> ConfigManager::get_env_int(const std::string& name) const {
     
     try {
         return std::stoi(*value);
-    } catch (...) {
+    } catch (const std::exception&) {
         return std::nullopt;
     }
 }
@@ -841,261 +932,62 @@ std::optional<float> ConfigManager::get_env_float(const std::string& name) const
     
     try {
         return std::stof(*value);
-    } catch (...) {
+    } catch (const std::exception&) {
         return std::nullopt;
     }
 }
 
 bool ConfigManager::set_config_value(ConfigData& config, const std::string& key, const std::string& value) {
-    if (value.empty()) {
-        // Unset the value
-        if (key == "default_model") config.default_model = std::nullopt;
-        else if (key == "models_directory") config.models_directory = std::nullopt;
-        else if (key == "use_coreml") config.use_coreml = std::nullopt;
-        else if (key == "coreml_no_ane") config.coreml_no_ane = std::nullopt;
-        else if (key == "coreml_model") config.coreml_model = std::nullopt;
-        else if (key == "capture_device") config.capture_device = std::nullopt;
-        else if (key == "step_ms") config.step_ms = std::nullopt;
-        else if (key == "length_ms") config.length_ms = std::nullopt;
-        else if (key == "keep_ms") config.keep_ms = std::nullopt;
-        else if (key == "vad_threshold") config.vad_threshold = std::nullopt;
-        else if (key == "freq_threshold") config.freq_threshold = std::nullopt;
-        else if (key == "threads") config.threads = std::nullopt;
-        else if (key == "max_tokens") config.max_tokens = std::nullopt;
-        else if (key == "beam_size") config.beam_size = std::nullopt;
-        else if (key == "language") config.language = std::nullopt;
-        else if (key == "translate") config.translate = std::nullopt;
-        else if (key == "no_timestamps") config.no_timestamps = std::nullopt;
-        else if (key == "print_special") config.print_special = std::nullopt;
-        else if (key == "print_colors") config.print_colors = std::nullopt;
-        else if (key == "save_audio") config.save_audio = std::nullopt;
-        else if (key == "tinydiarize") config.tinydiarize = std::nullopt;
-        else if (key == "output_file") config.output_file = std::nullopt;
-        else if (key == "output_format") config.output_format = std::nullopt;
-        else if (key == "output_mode") config.output_mode = std::nullopt;
-        else if (key == "auto_copy_enabled") config.auto_copy_enabled = std::nullopt;
-        else if (key == "auto_copy_max_duration_hours") config.auto_copy_max_duration_hours = std::nullopt;
-        else if (key == "auto_copy_max_size_bytes") config.auto_copy_max_size_bytes = std::nullopt;
-        else if (key == "meeting_mode") config.meeting_mode = std::nullopt;
-        else if (key == "meeting_prompt") config.meeting_prompt = std::nullopt;
-        else if (key == "meeting_name") config.meeting_name = std::nullopt;
-        else if (key == "meeting_initial_prompt") config.meeting_initial_prompt = std::nullopt;
-        else if (key == "meeting_timeout") config.meeting_timeout = std::nullopt;
-        else if (key == "meeting_max_single_pass") config.meeting_max_single_pass = std::nullopt;
-        else if (key == "silence_timeout") config.silence_timeout = std::nullopt;
-        else if (key == "ptt_mode") config.ptt_mode = std::nullopt;
-        else if (key == "ptt_key") config.ptt_key = std::nullopt;
-        else if (key == "refine") config.refine = std::nullopt;
-        else if (key == "history_enabled") config.history_enabled = std::nullopt;
-        else if (key == "entropy_thold") config.entropy_thold = std::nullopt;
-        else if (key == "logprob_thold") config.logprob_thold = std::nullopt;
-        else if (key == "no_speech_thold") config.no_speech_thold = std::nullopt;
-        else if (key == "length_penalty") config.length_penalty = std::nullopt;
-        else if (key == "best_of") config.best_of = std::nullopt;
-        else if (key == "suppress_nst") config.suppress_nst = std::nullopt;
-        else if (key == "carry_initial_prompt") config.carry_initial_prompt = std::nullopt;
-        else if (key == "normalize_audio") config.normalize_audio = std::nullopt;
-        else return false;
-        return true;
-    }
-    
-    try {
-        if (key == "default_model") config.default_model = value;
-        else if (key == "models_directory") config.models_directory = value;
-        else if (key == "use_coreml") {
-            std::string lower = value;
-            std::transform(lower.begin(), lower.end(), lower.begin(), ::tolower);
-            if (lower == "true" || lower == "1" || lower == "yes") config.use_coreml = true;
-            else if (lower == "false" || lower == "0" || lower == "no") config.use_coreml = false;
-            else return false;
-        }
-        else if (key == "coreml_no_ane") {
-            std::string lower = value;
-            std::transform(lower.begin(), lower.end(), lower.begin(), ::tolower);
-            if (lower == "true" || lower == "1" || lower == "yes") config.coreml_no_ane = true;
-            else if (lower == "false" || lower == "0" || lower == "no") config.coreml_no_ane = false;
-            else return false;
-        }
-        else if (key == "coreml_model") config.coreml_model = value;
-        else if (key == "capture_device") config.capture_device = std::stoi(value);
-        else if (key == "step_ms") config.step_ms = std::stoi(value);
-        else if (key == "length_ms") config.length_ms = std::stoi(value);
-        else if (key == "keep_ms") config.keep_ms = std::stoi(value);
-        else if (key == "vad_threshold") config.vad_threshold = std::stof(value);
-        else if (key == "freq_threshold") config.freq_threshold = std::stof(value);
-        else if (key == "threads") config.threads = std::stoi(value);
-        else if (key == "max_tokens") config.max_tokens = std::stoi(value);
-        else if (key == "beam_size") config.beam_size = std::stoi(value);
-        else if (key == "language") config.language = value;
-        else if (key == "translate") {
-            std::string lower = value;
-            std::transform(lower.begin(), lower.end(), lower.begin(), ::tolower);
-            if (lower == "true" || lower == "1" || lower == "yes") config.translate = true;
-            else if (lower == "false" || lower == "0" || lower == "no") config.translate = false;
-            else return false;
-        }
-        else if (key == "no_timestamps") {
-            std::string lower = value;
-            std::transform(lower.begin(), lower.end(), lower.begin(), ::tolower);
-            if (lower == "true" || lower == "1" || lower == "yes") config.no_timestamps = true;
-            else if (lower == "false" || lower == "0" || lower == "no") config.no_timestamps = false;
-            else return false;
-        }
-        else if (key == "print_special") {
-            std::string lower = value;
-            std::transform(lower.begin(), lower.end(), lower.begin(), ::tolower);
-            if (lower == "true" || lower == "1" || lower == "yes") config.print_special = true;
-            else if (lower == "false" || lower == "0" || lower == "no") config.print_special = false;
-            else return false;
-        }
-        else if (key == "print_colors") {
-            std::string lower = value;
-            std::transform(lower.begin(), lower.end(), lower.begin(), ::tolower);
-            if (lower == "true" || lower == "1" || lower == "yes") config.print_colors = true;
-            else if (lower == "false" || lower == "0" || lower == "no") config.print_colors = false;
-            else return false;
-        }
-        else if (key == "save_audio") {
-            std::string lower = value;
-            std::transform(lower.begin(), lower.end(), lower.begin(), ::tolower);
-            if (lower == "true" || lower == "1" || lower == "yes") config.save_audio = true;
-            else if (lower == "false" || lower == "0" || lower == "no") config.save_audio = false;
-            else return false;
-        }
-        else if (key == "tinydiarize") {
-            std::string lower = value;
-            std::transform(lower.begin(), lower.end(), lower.begin(), ::tolower);
-            if (lower == "true" || lower == "1" || lower == "yes") config.tinydiarize = true;
-            else if (lower == "false" || lower == "0" || lower == "no") config.tinydiarize = false;
-            else return false;
-        }
-        else if (key == "output_file") config.output_file = value;
-        else if (key == "output_format") config.output_format = value;
-        else if (key == "output_mode") config.output_mode = value;
-        else if (key == "auto_copy_enabled") {
-            std::string lower = value;
-            std::transform(lower.begin(), lower.end(), lower.begin(), ::tolower);
-            if (lower == "true" || lower == "1" || lower == "yes") config.auto_copy_enabled = true;
-            else if (lower == "false" || lower == "0" || lower == "no") config.auto_copy_enabled = false;
-            else return false;
+    const auto& fields = config_fields();
+    auto it = fields.find(key);
+    if (it == fields.end()) return false;
+
+    return std::visit([&](auto member) -> bool {
+        auto& field = config.*member;
+        using T = typename std::decay_t<decltype(field)>::value_type;
+
+        if (value.empty()) {
+            // Unset the value
+            field = std::nullopt;
+            return true;
         }
-        else if (key == "auto_copy_max_duration_hours") config.auto_copy_max_duration_hours = std::stoi(value);
-        else if (key == "auto_copy_max_size_bytes") config.auto_copy_max_size_bytes = std::stoi(value);
-        else if (key == "meeting_mode") {
-            std::string lower = value;
-            std::transform(lower.begin(), lower.end(), lower.begin(), ::tolower);
-            if (lower == "true" || lower == "1" || lower == "yes") config.meeting_mode = true;
-            else if (lower == "false" || lower == "0" || lower == "no") config.meeting_mode = false;
-            else return false;
-        }
-        else if (key == "meeting_prompt") config.meeting_prompt = value;
-        else if (key == "meeting_name") config.meeting_name = value;
-        else if (key == "meeting_initial_prompt") config.meeting_initial_prompt = value;
-        else if (key == "meeting_timeout") config.meeting_timeout = std::stoi(value);
-        else if (key == "meeting_max_single_pass") config.meeting_max_single_pass = std::stoi(value);
-        else if (key == "silence_timeout") config.silence_timeout = std::stof(value);
-        else if (key == "ptt_mode") {
-            std::string lower = value;
-            std::transform(lower.begin(), lower.end(), lower.begin(), ::tolower);
-            if (lower == "true" || lower == "1" || lower == "yes") config.ptt_mode = true;
-            else if (lower == "false" || lower == "0" || lower == "no") config.ptt_mode = false;
-            else return false;
-        }
-        else if (key == "ptt_key") config.ptt_key = value;
-        else if (key == "refine") {
-            std::string lower = value;
-            std::transform(lower.begin(), lower.end(), lower.begin(), ::tolower);
-            if (lower == "true" || lower == "1" || lower == "yes") config.refine = true;
-            else if (lower == "false" || lower == "0" || lower == "no") config.refine = false;
-            else return false;
-        }
-        else if (key == "history_enabled") {
-            config.history_enabled = (value == "true" || value == "1" || value == "yes");
-        }
-        else if (key == "entropy_thold") config.entropy_thold = std::stof(value);
-        else if (key == "logprob_thold") config.logprob_thold = std::stof(value);
-        else if (key == "no_speech_thold") config.no_speech_thold = std::stof(value);
-        else if (key == "length_penalty") config.length_penalty = std::stof(value);
-        else if (key == "best_of") config.best_of = std::stoi(value);
-        else if (key == "suppress_nst") {
-            std::string lower = value;
-            std::transform(lower.begin(), lower.end(), lower.begin(), ::tolower);
-            if (lower == "true" || lower == "1" || lower == "yes") config.suppress_nst = true;
-            else if (lower == "false" || lower == "0" || lower == "no") config.suppress_nst = false;
-            else return false;
-        }
-        else if (key == "carry_initial_prompt") {
-            std::string lower = value;
-            std::transform(lower.begin(), lower.end(), lower.begin(), ::tolower);
-            if (lower == "true" || lower == "1" || lower == "yes") config.carry_initial_prompt = true;
-            else if (lower == "false" || lower == "0" || lower == "no") config.carry_initial_prompt = false;
-            else return false;
-        }
-        else if (key == "normalize_audio") {
-            std::string lower = value;
-            std::transform(lower.begin(), lower.end(), lower.begin(), ::tolower);
-            if (lower == "true" || lower == "1" || lower == "yes") config.normalize_audio = true;
-            else if (lower == "false" || lower == "0" || lower == "no") config.normalize_audio = false;
-            else return false;
+
+        try {
+            if constexpr (std::is_same_v<T, std::string>) {
+                field = value;
+            } else if constexpr (std::is_same_v<T, bool>) {
+                // Invalid booleans are rejected without touching the current value
+                auto parsed = parse_bool(value);
+                if (!parsed) return false;
+                field = parsed;
+            } else if constexpr (std::is_same_v<T, int>) {
+                field = std::stoi(value);
+            } else {
+                field = std::stof(value);
+            }
+        } catch (const std::exception&) {
+            return false;
         }
-        else return false;
-    } catch (...) {
-        return false;
-    }
-    
-    return true;
+        return true;
+    }, it->second);
 }
 
 std::optional<std::string> ConfigManager::get_config_value(const ConfigData& config, const std::string& key) const {
-    if (key == "default_model") return config.default_model;
-    else if (key == "models_directory") return config.models_directory;
-    else if (key == "use_coreml") return config.use_coreml ? std::make_optional(*config.use_coreml ? "true" : "false") : std::nullopt;
-    else if (key == "coreml_no_ane") return config.coreml_no_ane ? std::make_optional(*config.coreml_no_ane ? "true" : "false") : std::nullopt;
-    else if (key == "coreml_model") return config.coreml_model;
-    else if (key == "capture_device") return config.capture_device ? std::make_optional(std::to_string(*config.capture_device)) : std::nullopt;
-    else if (key == "step_ms") return config.step_ms ? std::make_optional(std::to_string(*config.step_ms)) : std::nullopt;
-    else if (key == "length_ms") return config.length_ms ? std::make_optional(std::to_string(*config.length_ms)) : std::nullopt;
-    else if (key == "keep_ms") return config.keep_ms ? std::make_optional(std::to_string(*config.keep_ms)) : std::nullopt;
-    else if (key == "vad_threshold") return config.vad_threshold ? std::make_optional(std::to_string(*config.vad_threshold)) : std::nullopt;
-    else if (key == "freq_threshold") return config.freq_threshold ? std::make_optional(std::to_string(*config.freq_threshold)) : std::nullopt;
-    else if (key == "threads") return config.threads ? std::make_optional(std::to_string(*config.threads)) : std::nullopt;
-    else if (key == "max_tokens") return config.max_tokens ? std::make_optional(std::to_string(*config.max_tokens)) : std::nullopt;
-    else if (key == "beam_size") return config.beam_size ? std::make_optional(std::to_string(*config.beam_size)) : std::nullopt;
-    else if (key == "language") return config.language;
-    else if (key == "translate") return config.translate ? std::make_optional(*config.translate ? "true" : "false") : std::nullopt;
-    else if (key == "no_timestamps") return config.no_timestamps ? std::make_optional(*config.no_timestamps ? "true" : "false") : std::nullopt;
-    else if (key == "print_special") return config.print_special ? std::make_optional(*config.print_special ? "true" : "false") : std::nullopt;
-    else if (key == "print_colors") return config.print_colors ? std::make_optional(*config.print_colors ? "true" : "false") : std::nullopt;
-    else if (key == "save_audio") return config.save_audio ? std::make_optional(*config.save_audio ? "true" : "false") : std::nullopt;
-    else if (key == "tinydiarize") return config.tinydiarize ? std::make_optional(*config.tinydiarize ? "true" : "false") : std::nullopt;
-    else if (key == "output_file") return config.output_file;
-    else if (key == "output_format") return config.output_format;
-    else if (key == "output_mode") return config.output_mode;
-    else if (key == "auto_copy_enabled") return config.auto_copy_enabled ? std::make_optional(*config.auto_copy_enabled ? "true" : "false") : std::nullopt;
-    else if (key == "auto_copy_max_duration_hours") return config.auto_copy_max_duration_hours ? std::make_optional(std::to_string(*config.auto_copy_max_duration_hours)) : std::nullopt;
-    else if (key == "auto_copy_max_size_bytes") return config.auto_copy_max_size_bytes ? std::make_optional(std::to_string(*config.auto_copy_max_size_bytes)) : std::nullopt;
-    else if (key == "meeting_mode") return config.meeting_mode ? std::make_optional(*config.meeting_mode ? "true" : "false") : std::nullopt;
-    else if (key == "meeting_prompt") return config.meeting_prompt;
-    else if (key == "meeting_name") return config.meeting_name;
-    else if (key == "meeting_initial_prompt") return config.meeting_initial_prompt;
-    else if (key == "meeting_timeout") return config.meeting_timeout ? std::make_optional(std::to_string(*config.meeting_timeout)) : std::nullopt;
-    else if (key == "meeting_max_single_pass") return config.meeting_max_single_pass ? std::make_optional(std::to_string(*config.meeting_max_single_pass)) : std::nullopt;
-    else if (key == "silence_timeout") return config.silence_timeout ? std::make_optional(std::to_string(*config.silence_timeout)) : std::nullopt;
-    else if (key == "ptt_mode") return config.ptt_mode ? std::make_optional(*config.ptt_mode ? "true" : "false") : std::nullopt;
-    else if (key == "ptt_key") return config.ptt_key;
-    else if (key == "refine") return config.refine ? std::make_optional(*config.refine ? "true" : "false") : std::nullopt;
-    else if (key == "history_enabled") {
-        return config.history_enabled ?
-            std::make_optional(*config.history_enabled ? "true" : "false") : std::nullopt;
-    }
-    else if (key == "entropy_thold") return config.entropy_thold ? std::make_optional(std::to_string(*config.entropy_thold)) : std::nullopt;
-    else if (key == "logprob_thold") return config.logprob_thold ? std::make_optional(std::to_string(*config.logprob_thold)) : std::nullopt;
-    else if (key == "no_speech_thold") return config.no_speech_thold ? std::make_optional(std::to_string(*config.no_speech_thold)) : std::nullopt;
-    else if (key == "length_penalty") return config.length_penalty ? std::make_optional(std::to_string(*config.length_penalty)) : std::nullopt;
-    else if (key == "best_of") return config.best_of ? std::make_optional(std::to_string(*config.best_of)) : std::nullopt;
-    else if (key == "suppress_nst") return config.suppress_nst ? std::make_optional(*config.suppress_nst ? "true" : "false") : std::nullopt;
-    else if (key == "carry_initial_prompt") return config.carry_initial_prompt ? std::make_optional(*config.carry_initial_prompt ? "true" : "false") : std::nullopt;
-    else if (key == "normalize_audio") return config.normalize_audio ? std::make_optional(*config.normalize_audio ? "true" : "false") : std::nullopt;
-
-    return std::nullopt;
+    const auto& fields = config_fields();
+    auto it = fields.find(key);
+    if (it == fields.end()) return std::nullopt;
+
+    return std::visit([&](auto member) -> std::optional<std::string> {
+        const auto& field = config.*member;
+        using T = typename std::decay_t<decltype(field)>::value_type;
+
+        if (!field) return std::nullopt;
+        if constexpr (std::is_same_v<T, std::string>) {
+            return *field;
+        } else if constexpr (std::is_same_v<T, bool>) {
+            return std::string(*field ? "true" : "false");
+        } else {
+            return std::to_string(*field);
+        }
+    }, it->second);
 }
@@ -3,6 +3,7 @@
 #include <string>
 #include <map>
 #include <optional>
+#include <initializer_list>
 #include <vector>
 #include "whisper_params.h"
 
@@ -103,22 +104,24 @@ public:
     // Validation
     bool validate_config() const;
     
-    // Get effective configuration (merged from all sources)
-    ConfigData get_effective_config() const;
+    // Get effective configuration (merged from all sources, cached until a source changes)
+    const ConfigData& get_effective_config() const;
 
 private:
     ConfigData user_config_;
     ConfigData project_config_;
     ConfigData env_config_;
+    mutable std::optional<ConfigData> effective_cache_;
     
     std::string user_config_path_;
     std::string project_config_path_;
+    mutable bool project_config_found_ = false;
     
     // Helper methods
     void init_config_paths();
     ConfigData load_config_file(const std::string& filepath) const;
     bool save_config_file(const std::string& filepath, const ConfigData& config) const;
-    ConfigData merge_configs(const std::vector<ConfigData>& configs) const;
+    ConfigData merge_configs(std::initializer_list<const ConfigData*> configs) const;
     
     // JSON serialization
     std::string config_to_json(const ConfigData& config) const;
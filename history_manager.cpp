@@ -1,6 +1,7 @@
 #include "history_manager.h"
 
 #include <sqlite3.h>
+#include <algorithm>
 #include <filesystem>
 #include <iostream>
 #include <sstream>
@@ -534,9 +535,20 @@ std::string HistoryManager::truncate_text(const std::string& text, size_t max_le
 }
 
 std::string HistoryManager::escape_json(const std::string& str) {
+    // Fast path: most transcripts contain nothing that needs escaping
+    auto needs_escape = [](char c) {
+        return c == '"' || c == '\\' || static_cast<unsigned char>(c) < 0x20;
+    };
+    auto first = std::find_if(str.begin(), str.end(), needs_escape);
+    if (first == str.end()) {
+        return str;
+    }
+
     std::string out;
     out.reserve(str.size() + 16);
-    for (char c : str) {
+    out.append(str.begin(), first);
+    for (auto it = first; it != str.end(); ++it) {
+        char c = *it;
         switch (c) {
             case '"':  out += "\\\""; break;
             case '\\': out += "\\\\"; break;
@@ -619,8 +631,7 @@ std::string HistoryManager::format_table(const std::vector<Entry>& entries) {
 // format_json / format_entry_json
 // ---------------------------------------------------------------------------
 
-std::string HistoryManager::format_entry_json(const Entry& entry) {
-    std::ostringstream out;
+void HistoryManager::write_entry_json(std::ostream& out, const Entry& entry) {
     out << "{"
         << "\"id\":" << entry.id << ","
         << "\"timestamp\":\"" << escape_json(entry.timestamp) << "\","
@@ -630,17 +641,24 @@ std::string HistoryManager::format_entry_json(const Entry& entry) {
         << "\"word_count\":" << entry.word_count << ","
         << "\"text\":\"" << escape_json(entry.text) << "\""
         << "}";
+}
+
+std::string HistoryManager::format_entry_json(const Entry& entry) {
+    std::ostringstream out;
+    write_entry_json(out, entry);
     return out.str();
 }
 
 std::string HistoryManager::format_json(const std::vector<Entry>& entries) {
+    // Entries are written straight into one stream rather than each being
+    // formatted into its own string and copied in
     std::ostringstream out;
     out << "[";
     for (size_t i = 0; i < entries.size(); ++i) {
         if (i > 0) {
             out << ",";
         }
-        out << format_entry_json(entries[i]);
+        write_entry_json(out, entries[i]);
     }
     out << "]";
     return out.str();
@@ -4,6 +4,7 @@
 #include <vector>
 #include <optional>
 #include <cstdint>
+#include <iosfwd>
 
 struct sqlite3;
 
@@ -56,4 +57,5 @@ private:
     static std::string relative_time(const std::string& iso_timestamp);
     static std::string truncate_text(const std::string& text, size_t max_len);
     static std::string escape_json(const std::string& str);
+    static void write_entry_json(std::ostream& out, const Entry& entry);
 };
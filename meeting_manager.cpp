@@ -149,11 +149,6 @@ std::string generate_meeting_filename(const std::string& meeting_name) {
     return filename;
 }
 
-std::string generate_fallback_filename() {
-    // Alias to generate_meeting_filename for backward compatibility
-    return generate_meeting_filename("");
-}
-
 bool process_meeting_transcription(const std::string& transcription, const std::string& prompt,
                                     const std::string& output_file, int timeout_seconds,
                                     double duration_minutes, int max_single_pass) {
@@ -215,32 +210,37 @@ bool process_meeting_transcription(const std::string& transcription, const std::
     }
 
     // Helper to substitute all placeholders in a prompt
+    static const std::string transcript_placeholder = "[TRANSCRIPT_PLACEHOLDER]";
+    static const std::string legacy_placeholder = "[Paste raw transcription here]";
+    static const std::string duration_placeholder = "[DURATION_PLACEHOLDER]";
+    static const std::string date_placeholder = "[MEETING_DATE]";
+
+    auto replace_all = [](std::string& text, const std::string& placeholder, const std::string& value) {
+        size_t pos = 0;
+        while ((pos = text.find(placeholder, pos)) != std::string::npos) {
+            text.replace(pos, placeholder.length(), value);
+            pos += value.length();
+        }
+    };
+
     auto substitute_placeholders = [&](std::string& prompt, const std::string& transcript_content) {
+        // Fill the small placeholders first so the scans don't walk the inserted transcript
+        replace_all(prompt, duration_placeholder, duration_str_val);
+        replace_all(prompt, date_placeholder, meeting_date);
+
         // Replace transcript placeholder
-        size_t pos = prompt.find("[TRANSCRIPT_PLACEHOLDER]");
+        size_t pos = prompt.find(transcript_placeholder);
         if (pos != std::string::npos) {
-            prompt.replace(pos, std::string("[TRANSCRIPT_PLACEHOLDER]").length(), transcript_content);
+            prompt.replace(pos, transcript_placeholder.length(), transcript_content);
         } else {
             // Legacy placeholder support
-            pos = prompt.find("[Paste raw transcription here]");
+            pos = prompt.find(legacy_placeholder);
             if (pos != std::string::npos) {
-                prompt.replace(pos, std::string("[Paste raw transcription here]").length(), transcript_content);
+                prompt.replace(pos, legacy_placeholder.length(), transcript_content);
             } else {
                 prompt += "\n\n## RAW TRANSCRIPTION:\n" + transcript_content;
             }
         }
-        // Replace duration placeholder
-        pos = 0;
-        while ((pos = prompt.find("[DURATION_PLACEHOLDER]", pos)) != std::string::npos) {
-            prompt.replace(pos, std::string("[DURATION_PLACEHOLDER]").length(), duration_str_val);
-            pos += duration_str_val.length();
-        }
-        // Replace meeting date placeholder
-        pos = 0;
-        while ((pos = prompt.find("[MEETING_DATE]", pos)) != std::string::npos) {
-            prompt.replace(pos, std::string("[MEETING_DATE]").length(), meeting_date);
-            pos += meeting_date.length();
-        }
     };
 
     int word_count = count_words(transcription);
@@ -308,16 +308,19 @@ bool process_meeting_transcription(const std::string& transcription, const std::
     file << final_output;
     file << "\n\n<!--\n";
     file << "## Original Raw Transcription\n\n";
-    // Escape --> in transcription to prevent breaking the HTML comment
-    std::string safe_transcription = transcription;
+    // Escape --> in transcription to prevent breaking the HTML comment. Written
+    // slice by slice in one scan rather than copying the transcript and
+    // shifting its tail on every replace().
     {
-        size_t pos = 0;
-        while ((pos = safe_transcription.find("-->", pos)) != std::string::npos) {
-            safe_transcription.replace(pos, 3, "--&gt;");
-            pos += 5;
+        size_t start = 0;
+        size_t pos;
+        while ((pos = transcription.find("-->", start)) != std::string::npos) {
+            file.write(transcription.data() + start, pos - start);
+            file << "--&gt;";
+            start = pos + 3;
         }
+        file.write(transcription.data() + start, transcription.size() - start);
     }
-    file << safe_transcription;
     file << "\n-->\n";
     file.close();
 
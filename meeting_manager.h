@@ -25,7 +25,6 @@ struct MeetingSession {
 
 // File generation
 std::string generate_meeting_filename(const std::string& meeting_name);
-std::string generate_fallback_filename();
 
 // Meeting transcription processing via Claude CLI
 bool process_meeting_transcription(const std::string& transcription, const std::string& prompt,
@@ -22,7 +22,7 @@ ModelManager::ModelManager() {
         models_dir_ = "models";
     }
     init_model_registry();
-    ensure_models_directory();
+    // The directory is created on first download, not on every construction
 }
 
 void ModelManager::init_model_registry() {
@@ -156,7 +156,6 @@ void ModelManager::ensure_models_directory() {
 
 void ModelManager::set_models_directory(const std::string& models_dir) {
     models_dir_ = models_dir;
-    ensure_models_directory();
 }
 
 std::string ModelManager::get_models_directory() const {
@@ -182,41 +181,47 @@ bool ModelManager::coreml_model_exists(const std::string& model_name) {
 }
 
 std::string ModelManager::get_model_path(const std::string& model_name) {
-    if (models_.find(model_name) == models_.end()) {
+    auto it = models_.find(model_name);
+    if (it == models_.end()) {
         return "";
     }
     
-    return models_dir_ + "/" + models_[model_name].filename;
+    return models_dir_ + "/" + it->second.filename;
 }
 
 std::string ModelManager::get_coreml_model_path(const std::string& model_name) {
-    if (models_.find(model_name) == models_.end()) {
+    auto it = models_.find(model_name);
+    if (it == models_.end()) {
         return "";
     }
     
-    return models_dir_ + "/" + models_[model_name].coreml_filename;
+    return models_dir_ + "/" + it->second.coreml_filename;
 }
 
 void ModelManager::list_available_models() {
-    std::cout << "\n🤖 Available Whisper Models:\n\n";
+    print_available_models(std::cout);
+}
+
+void ModelManager::print_available_models(std::ostream& out) {
+    out << "\n🤖 Available Whisper Models:\n\n";
     
-    std::cout << "📱 English-only models (recommended for English speech):\n";
+    out << "📱 English-only models (recommended for English speech):\n";
     for (const auto& [name, info] : models_) {
         if (!info.multilingual) {
             std::string status = model_exists(name) ? "✅ Downloaded" : "⬇️  Available";
-            std::cout << "  " << name << " - " << info.description << " [" << status << "]\n";
+            out << "  " << name << " - " << info.description << " [" << status << "]\n";
         }
     }
     
-    std::cout << "\n🌍 Multilingual models (99 languages):\n";
+    out << "\n🌍 Multilingual models (99 languages):\n";
     for (const auto& [name, info] : models_) {
         if (info.multilingual) {
             std::string status = model_exists(name) ? "✅ Downloaded" : "⬇️  Available";
-            std::cout << "  " << name << " - " << info.description << " [" << status << "]\n";
+            out << "  " << name << " - " << info.description << " [" << status << "]\n";
         }
     }
     
-    std::cout << "\n💡 Recommendation: Start with 'base.en' for English speech (good speed/accuracy balance)\n";
+    out << "\n💡 Recommendation: Start with 'base.en' for English speech (good speed/accuracy balance)\n";
 }
 
 std::vector<std::string> ModelManager::get_model_names() {
@@ -349,12 +354,12 @@ void ModelManager::show_storage_usage() {
 }
 
 std::string ModelManager::prompt_model_selection() {
-    std::cout << "\n🤔 No model specified. Let's choose one!\n";
-    list_available_models();
+    std::cerr << "\n🤔 No model specified. Let's choose one!\n";
+    print_available_models(std::cerr);
 
     while (true) {
-        std::cout << "\nWhich model would you like to use? ";
-        std::cout << "(or 'q' to quit): ";
+        std::cerr << "\nWhich model would you like to use? ";
+        std::cerr << "(or 'q' to quit): ";
 
         std::string choice;
         if (!std::getline(std::cin, choice) || choice == "q" || choice == "quit") {
@@ -365,26 +370,26 @@ std::string ModelManager::prompt_model_selection() {
             return choice;
         }
 
-        std::cout << "❌ Invalid model name. Please choose from the list above.\n";
+        std::cerr << "❌ Invalid model name. Please choose from the list above.\n";
     }
 }
 
 bool ModelManager::prompt_download_confirmation(const std::string& model_name) {
     ModelInfo info = get_model_info(model_name);
     
-    std::cout << "\n📦 Model '" << model_name << "' not found locally.\n";
-    std::cout << "📄 " << info.description << "\n";
-    std::cout << "📁 Size: " << info.size_mb << " MB\n";
+    std::cerr << "\n📦 Model '" << model_name << "' not found locally.\n";
+    std::cerr << "📄 " << info.description << "\n";
+    std::cerr << "📁 Size: " << info.size_mb << " MB\n";
     
 #ifdef __APPLE__
-    std::cout << "🚀 CoreML acceleration: Available\n";
+    std::cerr << "🚀 CoreML acceleration: Available\n";
 #endif
     
-    std::cout << "\nChoose an option:\n";
-    std::cout << "  1. Download '" << model_name << "' (" << info.size_mb << " MB)\n";
-    std::cout << "  2. Choose a different model\n";
-    std::cout << "  3. Cancel\n";
-    std::cout << "\nEnter choice [1-3]: ";
+    std::cerr << "\nChoose an option:\n";
+    std::cerr << "  1. Download '" << model_name << "' (" << info.size_mb << " MB)\n";
+    std::cerr << "  2. Choose a different model\n";
+    std::cerr << "  3. Cancel\n";
+    std::cerr << "\nEnter choice [1-3]: ";
     
     std::string response;
     std::getline(std::cin, response);
@@ -401,26 +406,26 @@ bool ModelManager::prompt_download_confirmation(const std::string& model_name) {
 std::string ModelManager::prompt_model_not_found(const std::string& model_name, bool use_coreml) {
     ModelInfo info = get_model_info(model_name);
     
-    std::cout << "\n📦 Model '" << model_name << "' not found locally.\n";
-    std::cout << "📄 " << info.description << "\n";
-    std::cout << "📁 Size: " << info.size_mb << " MB\n";
+    std::cerr << "\n📦 Model '" << model_name << "' not found locally.\n";
+    std::cerr << "📄 " << info.description << "\n";
+    std::cerr << "📁 Size: " << info.size_mb << " MB\n";
     
 #ifdef __APPLE__
-    std::cout << "🚀 CoreML acceleration: Available\n";
+    std::cerr << "🚀 CoreML acceleration: Available\n";
 #endif
     
-    std::cout << "\nChoose an option:\n";
-    std::cout << "  1. Download '" << model_name << "' (" << info.size_mb << " MB)\n";
-    std::cout << "  2. Choose a different model\n";
-    std::cout << "  3. Cancel\n";
-    std::cout << "\nEnter choice [1-3]: ";
+    std::cerr << "\nChoose an option:\n";
+    std::cerr << "  1. Download '" << model_name << "' (" << info.size_mb << " MB)\n";
+    std::cerr << "  2. Choose a different model\n";
+    std::cerr << "  3. Cancel\n";
+    std::cerr << "\nEnter choice [1-3]: ";
     
     std::string response;
     std::getline(std::cin, response);
     
     if (response == "1" || response.empty()) {
         // Download the requested model
-        std::cout << "\n🚀 Starting download...\n";
+        std::cerr << "\n🚀 Starting download...\n";
         
         if (!download_model(model_name)) {
             return "";
@@ -428,9 +433,9 @@ std::string ModelManager::prompt_model_not_found(const std::string& model_name,
         
         #ifdef __APPLE__
         if (use_coreml) {
-            std::cout << "\n🤖 Downloading CoreML acceleration model...\n";
+            std::cerr << "\n🤖 Downloading CoreML acceleration model...\n";
             if (!download_coreml_model(model_name)) {
-                std::cout << "⚠️  CoreML download failed, will use regular model\n";
+                std::cerr << "⚠️  CoreML download failed, will use regular model\n";
             }
         }
         #endif
@@ -449,46 +454,47 @@ std::string ModelManager::prompt_model_not_found(const std::string& model_name,
         return resolve_model(selected_model, use_coreml);
         
     } else {
-        std::cout << "\n❌ Operation cancelled.\n";
+        std::cerr << "\n❌ Operation cancelled.\n";
         return "";
     }
 }
 
 ModelInfo ModelManager::get_model_info(const std::string& model_name) {
-    if (models_.find(model_name) != models_.end()) {
-        return models_[model_name];
+    auto it = models_.find(model_name);
+    if (it != models_.end()) {
+        return it->second;
     }
     return {};
 }
 
 bool ModelManager::download_file(const std::string& url, const std::string& filepath, bool show_progress) {
-    std::cout << "⬇️  Downloading: " << std::filesystem::path(filepath).filename().string() << "\n";
-    std::cout << "🔗 From: " << url << "\n";
+    std::cerr << "⬇️  Downloading: " << std::filesystem::path(filepath).filename().string() << "\n";
+    std::cerr << "🔗 From: " << url << "\n";
     
     // Use curl to download with progress
     std::string command = "curl -L --progress-bar \"" + url + "\" -o \"" + filepath + "\"";
     
     if (show_progress) {
-        std::cout << "📊 Progress:\n";
+        std::cerr << "📊 Progress:\n";
     }
     
     int result = std::system(command.c_str());
     
     if (result == 0 && std::filesystem::exists(filepath)) {
-        std::cout << "✅ Download completed: " << filepath << "\n";
+        std::cerr << "✅ Download completed: " << filepath << "\n";
         return true;
     } else {
-        std::cout << "❌ Download failed for: " << filepath << "\n";
+        std::cerr << "❌ Download failed for: " << filepath << "\n";
         return false;
     }
 }
 
 bool ModelManager::extract_coreml_model(const std::string& zip_path, const std::string& extract_dir) {
-    std::cout << "📦 Extracting CoreML model...\n";
+    std::cerr << "📦 Extracting CoreML model...\n";
     
     // Check if zip file exists
     if (!std::filesystem::exists(zip_path)) {
-        std::cout << "❌ Zip file not found: " << zip_path << "\n";
+        std::cerr << "❌ Zip file not found: " << zip_path << "\n";
         return false;
     }
     
@@ -518,12 +524,14 @@ bool ModelManager::extract_coreml_model(const std::string& zip_path, const std::
 }
 
 bool ModelManager::download_model(const std::string& model_name, bool show_progress) {
-    if (models_.find(model_name) == models_.end()) {
-        std::cout << "❌ Unknown model: " << model_name << "\n";
+    auto it = models_.find(model_name);
+    if (it == models_.end()) {
+        std::cerr << "❌ Unknown model: " << model_name << "\n";
         return false;
     }
     
-    ModelInfo info = models_[model_name];
+    const ModelInfo& info = it->second;
+    ensure_models_directory();
     std::string filepath = get_model_path(model_name);
     
     return download_file(info.url, filepath, show_progress);
@@ -531,16 +539,18 @@ bool ModelManager::download_model(const std::string& model_name, bool show_progr
 
 bool ModelManager::download_coreml_model(const std::string& model_name, bool show_progress) {
 #ifndef __APPLE__
-    std::cout << "ℹ️  CoreML models are only available on macOS\n";
+    std::cerr << "ℹ️  CoreML models are only available on macOS\n";
     return false;
 #endif
     
-    if (models_.find(model_name) == models_.end()) {
-        std::cout << "❌ Unknown model: " << model_name << "\n";
+    auto it = models_.find(model_name);
+    if (it == models_.end()) {
+        std::cerr << "❌ Unknown model: " << model_name << "\n";
         return false;
     }
     
-    ModelInfo info = models_[model_name];
+    const ModelInfo& info = it->second;
+    ensure_models_directory();
     std::string zip_path = models_dir_ + "/" + info.coreml_filename + ".zip";
     
     // Download the zip file
@@ -553,34 +563,34 @@ bool ModelManager::download_coreml_model(const std::string& model_name, bool sho
 }
 
 void ModelManager::show_usage_examples(const std::string& model_name) {
-    std::cout << "\n🎉 Setup complete! Here's how to use your model:\n\n";
+    std::cerr << "\n🎉 Setup complete! Here's how to use your model:\n\n";
     
-    std::cout << "🎤 Basic real-time transcription:\n";
-    std::cout << "   recognize -m " << model_name << "\n\n";
+    std::cerr << "🎤 Basic real-time transcription:\n";
+    std::cerr << "   recognize -m " << model_name << "\n\n";
     
-    std::cout << "🎯 VAD mode (recommended - only transcribes when you speak):\n";
-    std::cout << "   recognize -m " << model_name << " --step 0 --length 30000\n\n";
+    std::cerr << "🎯 VAD mode (recommended - only transcribes when you speak):\n";
+    std::cerr << "   recognize -m " << model_name << " --step 0 --length 30000\n\n";
     
-    std::cout << "⚡ Continuous mode (transcribes every 500ms):\n";
-    std::cout << "   recognize -m " << model_name << " --step 500 --length 5000\n\n";
+    std::cerr << "⚡ Continuous mode (transcribes every 500ms):\n";
+    std::cerr << "   recognize -m " << model_name << " --step 500 --length 5000\n\n";
     
-    std::cout << "💾 Save transcription to file:\n";
-    std::cout << "   recognize -m " << model_name << " -f transcript.txt\n\n";
+    std::cerr << "💾 Save transcription to file:\n";
+    std::cerr << "   recognize -m " << model_name << " -f transcript.txt\n\n";
     
-    std::cout << "🎛️  Use specific microphone:\n";
-    std::cout << "   recognize -m " << model_name << " -c 3\n\n";
+    std::cerr << "🎛️  Use specific microphone:\n";
+    std::cerr << "   recognize -m " << model_name << " -c 3\n\n";
     
     if (models_[model_name].multilingual) {
-        std::cout << "🌍 Transcribe other languages:\n";
-        std::cout << "   recognize -m " << model_name << " -l es  # Spanish\n";
-        std::cout << "   recognize -m " << model_name << " -l fr  # French\n\n";
+        std::cerr << "🌍 Transcribe other languages:\n";
+        std::cerr << "   recognize -m " << model_name << " -l es  # Spanish\n";
+        std::cerr << "   recognize -m " << model_name << " -l fr  # French\n\n";
         
-        std::cout << "🔄 Translate to English:\n";
-        std::cout << "   recognize -m " << model_name << " -l es --translate\n\n";
+        std::cerr << "🔄 Translate to English:\n";
+        std::cerr << "   recognize -m " << model_name << " -l es --translate\n\n";
     }
     
-    std::cout << "📚 For more options: recognize --help\n\n";
-    std::cout << "🚀 Ready to start? Try the VAD mode command above!\n";
+    std::cerr << "📚 For more options: recognize --help\n\n";
+    std::cerr << "🚀 Ready to start? Try the VAD mode command above!\n";
 }
 
 std::string ModelManager::resolve_model(const std::string& model_arg, bool use_coreml) {
@@ -596,16 +606,16 @@ std::string ModelManager::resolve_model(const std::string& model_arg, bool use_c
     
     // Check if it's a direct file path
     if (std::filesystem::exists(model_name)) {
-        std::cout << "✅ Using existing model file: " << model_name << "\n";
+        std::cerr << "✅ Using existing model file: " << model_name << "\n";
         return model_name;
     }
     
     // Check if it's a known model name
     if (models_.find(model_name) == models_.end()) {
-        std::cout << "❌ Unknown model: " << model_name << "\n";
-        std::cout << "Available models:\n";
+        std::cerr << "❌ Unknown model: " << model_name << "\n";
+        std::cerr << "Available models:\n";
         for (const auto& name : get_model_names()) {
-            std::cout << "  - " << name << "\n";
+            std::cerr << "  - " << name << "\n";
         }
         return "";
     }
@@ -617,8 +627,8 @@ std::string ModelManager::resolve_model(const std::string& model_arg, bool use_c
         // Also check/download CoreML model if requested and not exists
         #ifdef __APPLE__
         if (use_coreml && !coreml_model_exists(model_name)) {
-            std::cout << "🚀 CoreML acceleration requested but CoreML model not found.\n";
-            std::cout << "Would you like to download the CoreML version? [Y/n]: ";
+            std::cerr << "🚀 CoreML acceleration requested but CoreML model not found.\n";
+            std::cerr << "Would you like to download the CoreML version? [Y/n]: ";
             std::string response;
             std::getline(std::cin, response);
             
@@ -902,7 +912,7 @@ bool ModelManager::download_vad_model(bool show_progress) {
     if (std::filesystem::exists(filepath)) {
         return true;
     }
-    std::cout << "Downloading Silero VAD model (~864 KB)..." << std::endl;
+    std::cerr << "Downloading Silero VAD model (~864 KB)..." << std::endl;
     return download_file(VAD_MODEL_URL, filepath, show_progress);
 }
 
@@ -1,5 +1,6 @@
 #pragma once
 
+#include <iosfwd>
 #include <string>
 #include <vector>
 #include <map>
@@ -72,5 +73,6 @@ private:
     bool download_file(const std::string& url, const std::string& filepath, bool show_progress);
     bool extract_coreml_model(const std::string& zip_path, const std::string& extract_dir);
     void show_usage_examples(const std::string& model_name);
+    void print_available_models(std::ostream& out);
     void show_download_progress(const std::string& filename, size_t downloaded, size_t total);
 };
\ No newline at end of file
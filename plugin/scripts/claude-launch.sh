@@ -11,9 +11,12 @@ PEON_CFG="$HOME/.claude/hooks/peon-ping/config.json"
 PIDFILE="$HOME/.recognize/claude-session.pid"
 TXTFILE="$HOME/.recognize/claude-session.txt"
 LOGFILE="$HOME/.recognize/claude-session.log"
+DONEFILE="$HOME/.recognize/claude-session.done"  # written by recognize after each PTT transcript
 MEETING_MODE=0
 NO_AUTO_STOP=0
 PTT_MODE=0
+# Flags shared by every mode: the transcript goes to stdout only, no export files
+BASE_CMD="recognize --no-export --no-timestamps"
 
 # Parse arguments
 for arg in "$@"; do
@@ -24,6 +27,47 @@ for arg in "$@"; do
   esac
 done
 
+# Re-enable peon-ping sounds on every exit path
+restore_peon() {
+  if [ -f "$PEON_CFG" ]; then
+    sed -i '' 's/"enabled": false/"enabled": true/' "$PEON_CFG"
+  fi
+}
+
+# SIGINT a process, then SIGKILL it only if it is still alive after $2 polls of
+# 50ms. A process that exits promptly ends the wait early instead of a fixed sleep.
+stop_pid() {
+  local pid=$1 polls=$2 i
+  kill -INT "$pid" 2>/dev/null || return 0
+  for ((i = 0; i < polls; i++)); do
+    kill -0 "$pid" 2>/dev/null || return 0
+    sleep 0.05
+  done
+  kill -9 "$pid" 2>/dev/null || true
+}
+
+# Echo the newest [PREVIEW] line from the daemon log. LOG_OFFSET is a byte offset:
+# each poll reads only what was appended since the last one (tail -c seeks), so the
+# cost stays flat however long a PTT daemon's log grows. Only newline-terminated
+# lines are consumed; a line the daemon is still writing is left for the next poll.
+show_new_preview() {
+  local size="" consumed="" preview=""
+  size=$(wc -c < "$LOGFILE" 2>/dev/null | tr -d ' ') || return 0
+  { [ -n "$size" ] && [ "$size" -gt "$LOG_OFFSET" ]; } || return 0
+  { read -r consumed; IFS= read -r preview; } < <(tail -c +"$((LOG_OFFSET + 1))" "$LOGFILE" 2>/dev/null |
+    LC_ALL=C awk -v avail="$((size - LOG_OFFSET))" '
+      { n += length($0) + 1 }
+      n > avail { exit }
+      /^\[PREVIEW/ { p = substr($0, index($0, "]") + 1) }
+      { done = n }
+      END { print done + 0; print p }') || true
+  LOG_OFFSET=$((LOG_OFFSET + ${consumed:-0}))
+  if [ -n "$preview" ] && [ "$preview" != "$LAST_PREVIEW" ]; then
+    echo "[Listening...]$preview"
+    LAST_PREVIEW="$preview"
+  fi
+}
+
 # Mute peon-ping sounds (non-blocking)
 [ -f "$PEON_CFG" ] && sed -i '' 's/"enabled": true/"enabled": false/' "$PEON_CFG"
 
@@ -43,7 +87,7 @@ if [ "$PTT_MODE" = "1" ]; then
         PTT_WARM=1
       else
         echo "ERROR: session already active, run /recognize:stop first"
-        [ -f "$PEON_CFG" ] && sed -i '' 's/"enabled": false/"enabled": true/' "$PEON_CFG"
+        restore_peon
         exit 1
       fi
     fi
@@ -51,53 +95,47 @@ if [ "$PTT_MODE" = "1" ]; then
 
   if [ "$PTT_WARM" = "1" ]; then
     # ─── Warm start: daemon already loaded, instant ready ───
-    # Count existing TRANSCRIPT_DONE markers to detect the next one
-    PREV_DONE_COUNT=$(grep -c "TRANSCRIPT_DONE" "$LOGFILE" 2>/dev/null || echo 0)
+    # Clear the previous completion marker; the daemon rewrites it when the next transcript is ready
+    rm -f "$DONEFILE"
 
     # Mark log position for preview filtering (only show new previews)
-    LOG_OFFSET=$(wc -l < "$LOGFILE" 2>/dev/null | tr -d ' ')
+    LOG_OFFSET=$(wc -c < "$LOGFILE" 2>/dev/null | tr -d ' ')
 
     echo "PTT_READY"
     printf '\n╔══════════════════════════════════════════════════════╗\n'
     printf '║   ▶  READY — hold SPACE to speak, release to send   ║\n'
     printf '╚══════════════════════════════════════════════════════╝\n\n'
 
-    # Wait for new TRANSCRIPT_DONE (poll log for count increase)
+    # Wait for the completion marker (a stat, instead of re-counting the whole log)
     LAST_PREVIEW=""
     while kill -0 "$RPID" 2>/dev/null; do
-      CUR_DONE=$(grep -c "TRANSCRIPT_DONE" "$LOGFILE" 2>/dev/null || echo 0)
-      if [ "$CUR_DONE" -gt "$PREV_DONE_COUNT" ]; then
+      if [ -f "$DONEFILE" ]; then
         break
       fi
 
-      # Stream preview lines (only from new log content)
-      PREVIEW=$(tail -n +"$((LOG_OFFSET + 1))" "$LOGFILE" 2>/dev/null | grep '^\[PREVIEW' | tail -1 | sed 's/^\[PREVIEW[^]]*\]//')
-      if [ -n "$PREVIEW" ] && [ "$PREVIEW" != "$LAST_PREVIEW" ]; then
-        echo "[Listening...]$PREVIEW"
-        LAST_PREVIEW="$PREVIEW"
-      fi
+      show_new_preview
 
       sleep 0.3
     done
 
     # Check if daemon died unexpectedly
     if ! kill -0 "$RPID" 2>/dev/null; then
-      CUR_DONE=$(grep -c "TRANSCRIPT_DONE" "$LOGFILE" 2>/dev/null || echo 0)
-      if [ "$CUR_DONE" -le "$PREV_DONE_COUNT" ]; then
+      if [ ! -f "$DONEFILE" ]; then
         echo "ERROR: PTT daemon exited unexpectedly"
-        rm -f "$PIDFILE" "$TXTFILE" "$LOGFILE"
-        [ -f "$PEON_CFG" ] && sed -i '' 's/"enabled": false/"enabled": true/' "$PEON_CFG"
+        rm -f "$PIDFILE" "$TXTFILE" "$LOGFILE" "$DONEFILE"
+        restore_peon
         exit 1
       fi
     fi
 
-    sleep 0.1
+    # recognize flushes the transcript before writing the completion marker.
+    # The clipboard copy runs in the background alongside the output.
+    pbcopy >/dev/null 2>&1 < "$TXTFILE" &
     echo "---TRANSCRIPT_START---"
     cat "$TXTFILE" 2>/dev/null
     echo "---TRANSCRIPT_END---"
-    cat "$TXTFILE" 2>/dev/null | pbcopy
     # Don't kill daemon or clean up files — keep warm for next /rp
-    [ -f "$PEON_CFG" ] && sed -i '' 's/"enabled": false/"enabled": true/' "$PEON_CFG"
+    restore_peon
     exit 0
   fi
 
@@ -106,40 +144,23 @@ if [ "$PTT_MODE" = "1" ]; then
   if [ -f "$PIDFILE" ]; then
     STALE_PID=$(cat "$PIDFILE" 2>/dev/null)
     if [ -n "$STALE_PID" ] && kill -0 "$STALE_PID" 2>/dev/null; then
-      kill -INT "$STALE_PID" 2>/dev/null || true
-      sleep 0.2
-      kill -0 "$STALE_PID" 2>/dev/null && kill -9 "$STALE_PID" 2>/dev/null || true
+      stop_pid "$STALE_PID" 4
     fi
   fi
 
-  rm -f "$PIDFILE" "$TXTFILE" "$LOGFILE"
+  rm -f "$PIDFILE" "$TXTFILE" "$LOGFILE" "$DONEFILE"
 
   # Launch with --ptt-loop for daemon mode (stays alive between transcriptions)
-  RECOGNIZE_CMD="recognize --ptt-loop --no-export --no-timestamps --model large-v3-turbo"
+  RECOGNIZE_CMD="$BASE_CMD --ptt-loop --model large-v3-turbo"
+  # Own process group (job control on for the spawn) so stop can kill claude children too
+  set -m
   nohup $RECOGNIZE_CMD > "$TXTFILE" 2>"$LOGFILE" &
   RPID=$!
+  set +m
   echo "$RPID" > "$PIDFILE"
 
-  # Liveness check
-  ALIVE=0
-  for i in $(seq 1 12); do
-    sleep 0.3
-    if kill -0 "$RPID" 2>/dev/null; then
-      ALIVE=1
-      break
-    fi
-  done
-
-  if [ "$ALIVE" = "0" ]; then
-    echo "ERROR: failed to start"
-    echo "---LOG---"
-    cat "$LOGFILE" 2>/dev/null
-    rm -f "$PIDFILE" "$TXTFILE" "$LOGFILE"
-    [ -f "$PEON_CFG" ] && sed -i '' 's/"enabled": false/"enabled": true/' "$PEON_CFG"
-    exit 1
-  fi
-
-  # Wait for PTT_READY signal (model load + CoreML warmup)
+  # Wait for PTT_READY signal (model load + CoreML warmup). This loop already
+  # stops on an early exit and reports the log, so no separate liveness delay.
   printf '\033[33m⏳ Loading model...\033[0m\n'
   READY=0
   for i in $(seq 1 200); do
@@ -157,8 +178,8 @@ if [ "$PTT_MODE" = "1" ]; then
     echo "ERROR: recognize failed to become ready"
     echo "---LOG---"
     cat "$LOGFILE" 2>/dev/null
-    rm -f "$PIDFILE" "$TXTFILE" "$LOGFILE"
-    [ -f "$PEON_CFG" ] && sed -i '' 's/"enabled": false/"enabled": true/' "$PEON_CFG"
+    rm -f "$PIDFILE" "$TXTFILE" "$LOGFILE" "$DONEFILE"
+    restore_peon
     exit 1
   fi
 
@@ -166,42 +187,38 @@ if [ "$PTT_MODE" = "1" ]; then
   echo "Ready — hold space to speak, release to send."
 
   # Mark log position for preview filtering
-  LOG_OFFSET=$(wc -l < "$LOGFILE" 2>/dev/null | tr -d ' ')
+  LOG_OFFSET=$(wc -c < "$LOGFILE" 2>/dev/null | tr -d ' ')
 
-  # Wait for first TRANSCRIPT_DONE
+  # Wait for the first completion marker
   LAST_PREVIEW=""
   while kill -0 "$RPID" 2>/dev/null; do
-    if grep -q "TRANSCRIPT_DONE" "$LOGFILE" 2>/dev/null; then
+    if [ -f "$DONEFILE" ]; then
       break
     fi
 
-    # Stream preview lines
-    PREVIEW=$(tail -n +"$((LOG_OFFSET + 1))" "$LOGFILE" 2>/dev/null | grep '^\[PREVIEW' | tail -1 | sed 's/^\[PREVIEW[^]]*\]//')
-    if [ -n "$PREVIEW" ] && [ "$PREVIEW" != "$LAST_PREVIEW" ]; then
-      echo "[Listening...]$PREVIEW"
-      LAST_PREVIEW="$PREVIEW"
-    fi
+    show_new_preview
 
     sleep 0.3
   done
 
   # Check for daemon death before transcript completed
   if ! kill -0 "$RPID" 2>/dev/null; then
-    if ! grep -q "TRANSCRIPT_DONE" "$LOGFILE" 2>/dev/null; then
+    if [ ! -f "$DONEFILE" ]; then
       echo "ERROR: recognize exited before transcription completed"
-      rm -f "$PIDFILE" "$TXTFILE" "$LOGFILE"
-      [ -f "$PEON_CFG" ] && sed -i '' 's/"enabled": false/"enabled": true/' "$PEON_CFG"
+      rm -f "$PIDFILE" "$TXTFILE" "$LOGFILE" "$DONEFILE"
+      restore_peon
       exit 1
     fi
   fi
 
-  sleep 0.1
+  # recognize flushes the transcript before writing the completion marker.
+  # The clipboard copy runs in the background alongside the output.
+  pbcopy >/dev/null 2>&1 < "$TXTFILE" &
   echo "---TRANSCRIPT_START---"
   cat "$TXTFILE" 2>/dev/null
   echo "---TRANSCRIPT_END---"
-  cat "$TXTFILE" 2>/dev/null | pbcopy
   # Don't kill daemon or clean up files — keep warm for next /rp
-  [ -f "$PEON_CFG" ] && sed -i '' 's/"enabled": false/"enabled": true/' "$PEON_CFG"
+  restore_peon
   exit 0
 fi
 
@@ -212,13 +229,11 @@ if [ -f "$PIDFILE" ] && kill -0 "$(cat "$PIDFILE")" 2>/dev/null; then
   # Allow non-PTT launch if a PTT daemon is running (kill it first)
   if grep -q "PTT_READY" "$LOGFILE" 2>/dev/null; then
     RPID=$(cat "$PIDFILE")
-    kill -INT "$RPID" 2>/dev/null || true
-    sleep 0.3
-    kill -0 "$RPID" 2>/dev/null && kill -9 "$RPID" 2>/dev/null || true
-    rm -f "$PIDFILE" "$TXTFILE" "$LOGFILE"
+    stop_pid "$RPID" 6
+    rm -f "$PIDFILE" "$TXTFILE" "$LOGFILE" "$DONEFILE"
   else
     echo "ERROR: session already active, run /recognize:stop first"
-    [ -f "$PEON_CFG" ] && sed -i '' 's/"enabled": false/"enabled": true/' "$PEON_CFG"
+    restore_peon
     exit 1
   fi
 fi
@@ -226,29 +241,34 @@ fi
 # Kill stale recognize processes only if they exist
 if pgrep -q recognize 2>/dev/null; then
   pkill -INT recognize 2>/dev/null || true
-  sleep 0.2
+  for ((i = 0; i < 4; i++)); do
+    pgrep -q recognize 2>/dev/null || break
+    sleep 0.05
+  done
   pkill -9 recognize 2>/dev/null || true
 fi
 
 # Clean up stale files from previous sessions
-rm -f "$PIDFILE" "$TXTFILE" "$LOGFILE"
+rm -f "$PIDFILE" "$TXTFILE" "$LOGFILE" "$DONEFILE"
 
 # Build recognize command based on mode
 if [ "$MEETING_MODE" = "1" ]; then
   # Meeting mode: large-v3-turbo for accuracy, meeting features enabled
-  RECOGNIZE_CMD="recognize --no-export --no-timestamps --meeting --model large-v3-turbo"
+  RECOGNIZE_CMD="$BASE_CMD --meeting --model large-v3-turbo"
 else
   # Voice input: base.en — best speed/accuracy balance (5% WER, <1s startup with CoreML)
   # --coreml-gpu-only skips ANE compilation for instant startup
-  RECOGNIZE_CMD="recognize --no-export --no-timestamps --model base.en --output-mode original --coreml-gpu-only"
+  RECOGNIZE_CMD="$BASE_CMD --model base.en --output-mode original --coreml-gpu-only"
   if [ "$NO_AUTO_STOP" = "0" ]; then
     RECOGNIZE_CMD="$RECOGNIZE_CMD --silence-timeout 5"
   fi
 fi
 
-# Launch recognize in background
+# Launch recognize in background, in its own process group (see claude-stop.sh)
+set -m
 nohup $RECOGNIZE_CMD > "$TXTFILE" 2>"$LOGFILE" &
 RPID=$!
+set +m
 echo "$RPID" > "$PIDFILE"
 
 # Liveness check — large models need longer (CoreML warm-up)
@@ -286,24 +306,34 @@ fi
 
 # ─── Blocking modes: wait for recognize to exit, return transcript ───
 
-# Auto-stop: poll with safety net (100s max)
+# Auto-stop: block until recognize exits, with a watchdog as safety net (100s max)
 echo "OK_WAITING"
-for i in $(seq 1 200); do
-  kill -0 "$RPID" 2>/dev/null || break
-  sleep 0.5
-done
-
-# Force stop if still running
-if kill -0 "$RPID" 2>/dev/null; then
-  kill -INT "$RPID" 2>/dev/null || true
-  sleep 0.5
-  kill -0 "$RPID" 2>/dev/null && kill -9 "$RPID" 2>/dev/null
-fi
-
-sleep 0.3
+# The watchdog polls for recognize's exit rather than sleeping 100s in one go,
+# so it ends with recognize instead of leaving an orphaned sleep behind, and it
+# writes nowhere so it never holds the caller's output pipe open.
+(
+  for ((i = 0; i < 1000; i++)); do
+    kill -0 "$RPID" 2>/dev/null || exit 0
+    sleep 0.1
+  done
+  stop_pid "$RPID" 10
+) >/dev/null 2>&1 &
+WATCHDOG=$!
+# If the launcher itself is interrupted or cancelled while blocking, take recognize
+# down with it instead of leaving it recording until the watchdog fires. Each step
+# is guarded: set -e applies inside the handler, and the watchdog may already be gone.
+trap 'kill "$WATCHDOG" 2>/dev/null || true; stop_pid "$RPID" 10; rm -f "$PIDFILE" "$TXTFILE" "$LOGFILE" "$DONEFILE"; restore_peon; exit 130' INT TERM HUP
+wait "$RPID" 2>/dev/null || true
+trap - INT TERM HUP
+kill "$WATCHDOG" 2>/dev/null || true
+
+# recognize has exited, so its output file is complete. The clipboard copy
+# runs alongside the output and is reaped before the file is removed.
+pbcopy >/dev/null 2>&1 < "$TXTFILE" &
+CLIP_PID=$!
 echo "---TRANSCRIPT_START---"
 cat "$TXTFILE" 2>/dev/null
 echo "---TRANSCRIPT_END---"
-cat "$TXTFILE" 2>/dev/null | pbcopy
-rm -f "$PIDFILE" "$TXTFILE" "$LOGFILE"
-[ -f "$PEON_CFG" ] && sed -i '' 's/"enabled": false/"enabled": true/' "$PEON_CFG"
+wait "$CLIP_PID" 2>/dev/null || true
+rm -f "$PIDFILE" "$TXTFILE" "$LOGFILE" "$DONEFILE"
+restore_peon
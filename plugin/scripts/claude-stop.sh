@@ -7,6 +7,7 @@ PEON_CFG="$HOME/.claude/hooks/peon-ping/config.json"
 PIDFILE="$HOME/.recognize/claude-session.pid"
 TXTFILE="$HOME/.recognize/claude-session.txt"
 LOGFILE="$HOME/.recognize/claude-session.log"
+DONEFILE="$HOME/.recognize/claude-session.done"
 
 # Check for active session
 if [ ! -f "$PIDFILE" ]; then
@@ -16,32 +17,37 @@ fi
 
 PID=$(cat "$PIDFILE")
 
-# Send SIGINT for graceful shutdown
-kill -INT "$PID" 2>/dev/null || true
-
-# Wait for process to exit (up to 1.6s)
-for i in $(seq 1 8); do
-  kill -0 "$PID" 2>/dev/null || break
-  sleep 0.2
-done
-
-# Force kill if still running
-if kill -0 "$PID" 2>/dev/null; then
-  kill -9 "$PID" 2>/dev/null || true
+# Only signal the PID while it is still recognize. A stale PID file (crashed
+# session, PID since reused) must not take down an unrelated process group.
+if [ -n "$PID" ] && ps -p "$PID" -o comm= 2>/dev/null | grep -q "recognize"; then
+  # Send SIGINT for graceful shutdown
+  kill -INT "$PID" 2>/dev/null || true
+
+  # Wait for process to exit (up to 1.6s), checking often so a fast exit returns promptly
+  for ((i = 0; i < 32; i++)); do
+    kill -0 "$PID" 2>/dev/null || break
+    sleep 0.05
+  done
+
+  # Force kill if still running. recognize leads its own process group, so this
+  # also takes down any claude CLI child still running a --refine/meeting pass.
+  if kill -0 "$PID" 2>/dev/null; then
+    kill -9 -- "-$PID" 2>/dev/null || kill -9 "$PID" 2>/dev/null || true
+  fi
 fi
 
-sleep 0.3
+# Copy to clipboard in the background while the transcript is output
+pbcopy >/dev/null 2>&1 < "$TXTFILE" &
+CLIP_PID=$!
 
 # Output transcript
 echo "---TRANSCRIPT_START---"
 cat "$TXTFILE" 2>/dev/null
 echo "---TRANSCRIPT_END---"
 
-# Copy to clipboard
-cat "$TXTFILE" 2>/dev/null | pbcopy
-
-# Clean up session files
-rm -f "$PIDFILE" "$TXTFILE" "$LOGFILE"
+# Clean up session files once the clipboard copy has read the transcript
+wait "$CLIP_PID" 2>/dev/null
+rm -f "$PIDFILE" "$TXTFILE" "$LOGFILE" "$DONEFILE"
 
 # Re-enable peon-ping sounds
 [ -f "$PEON_CFG" ] && sed -i '' 's/"enabled": false/"enabled": true/' "$PEON_CFG"
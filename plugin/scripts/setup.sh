@@ -77,7 +77,7 @@ Run the /recognize:history skill with arguments: $ARGUMENTS
 ALIAS
 
 echo "recognize setup complete."
-echo "  Binary: $(which recognize)"
+echo "  Binary: $(command -v recognize)"
 echo "  Config: $RECOGNIZE_DIR/"
 echo "  Aliases: $COMMANDS_DIR/{r,rs,rc,rp,rh}.md"
 echo ""
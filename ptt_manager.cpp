@@ -15,14 +15,6 @@ PushToTalkManager::~PushToTalkManager() {
     stop();
 }
 
-bool PushToTalkManager::is_key_held() const {
-    return key_held_.load();
-}
-
-bool PushToTalkManager::is_running() const {
-    return running_.load();
-}
-
 int PushToTalkManager::key_name_to_code(const std::string& name) {
     std::string lower = name;
     std::transform(lower.begin(), lower.end(), lower.begin(), ::tolower);
@@ -18,9 +18,10 @@ public:
     bool start(int key_code = 49);  // 49 = spacebar
     void stop();
 
-    // State queries (thread-safe)
-    bool is_key_held() const;
-    bool is_running() const;
+    // State queries (thread-safe). Inline flag reads: the PTT loop polls
+    // these every few milliseconds while waiting on the key.
+    bool is_key_held() const { return key_held_.load(std::memory_order_acquire); }
+    bool is_running() const { return running_.load(std::memory_order_acquire); }
 
     // Permission helpers
     static bool check_permission();
@@ -30,7 +30,6 @@
 #include <atomic>
 #include <future>
 #include <termios.h>
-#include <unistd.h>
 #include <fcntl.h>
 #include <filesystem>
 #include <iomanip>
@@ -85,7 +84,8 @@ static bool check_interrupt_with_confirmation() {
             return true;
         }
 
-        std::cout << "\n\n Recording in progress! Are you sure you want to quit? (y/N): " << std::flush;
+        // Prompt on stderr: stdout carries only transcript text when redirected
+        std::cerr << "\n\n Recording in progress! Are you sure you want to quit? (y/N): " << std::flush;
 
         struct termios old_termios, new_termios;
         tcgetattr(STDIN_FILENO, &old_termios);
@@ -98,11 +98,11 @@ static bool check_interrupt_with_confirmation() {
         tcsetattr(STDIN_FILENO, TCSANOW, &old_termios);
 
         if (c == 'y' || c == 'Y') {
-            std::cout << "\n Stopping recording and exiting...\n" << std::endl;
+            std::cerr << "\n Stopping recording and exiting...\n" << std::endl;
             g_is_recording.store(false);  // prevent re-prompting on subsequent checks
             return true;
         } else {
-            std::cout << "\n Continuing recording...\n" << std::endl;
+            std::cerr << "\n Continuing recording...\n" << std::endl;
             g_interrupt_received.store(false);
             return false;
         }
@@ -290,12 +290,14 @@ static void finalize_session(const whisper_params& params,
 }
 
 int main(int argc, char ** argv) {
-    // Handle "history" subcommand before any heavy initialization
+    // Handle "history" and "config" subcommands before any heavy initialization
+    // ("config" loads its own ConfigManager, so skip the one below)
     if (argc >= 2 && std::string(argv[1]) == "history") {
         return handle_history_command(argc - 2, argv + 2);
     }
-
-    ggml_backend_load_all();
+    if (argc >= 2 && std::string(argv[1]) == "config") {
+        return handle_config_command(argc - 2, argv + 2);
+    }
 
     // Register signal handler for graceful shutdown
     signal(SIGINT, signal_handler);
@@ -347,7 +349,7 @@ int main(int argc, char ** argv) {
     ModelManager model_manager;
     
     // Apply configured models directory if set
-    ConfigData effective_config = config_manager.get_effective_config();
+    const ConfigData& effective_config = config_manager.get_effective_config();
     if (effective_config.models_directory) {
         model_manager.set_models_directory(*effective_config.models_directory);
     }
@@ -482,6 +484,10 @@ int main(int argc, char ** argv) {
         exit(0);
     }
 
+    // Load compute backends only once we know a model will be initialized;
+    // --help, config and model-management invocations exit before this point.
+    ggml_backend_load_all();
+
     struct whisper_context_params cparams = whisper_context_default_params();
 
     #ifdef WHISPER_COREML
@@ -735,6 +741,18 @@ int main(int argc, char ** argv) {
         auto t_last_activity = std::chrono::high_resolution_clock::now();
         const int daemon_timeout_ms = 600000; // 10 minutes
 
+        // Completion marker for the launcher, resolved once per daemon session
+        std::string ptt_done_path;
+        if (params.ptt_loop) {
+            if (const char* home = getenv("HOME")) {
+                ptt_done_path = std::string(home) + "/.recognize/claude-session.done";
+            }
+        }
+
+        // History database, opened on first save and kept for the whole session
+        HistoryManager ptt_history;
+        bool ptt_history_open = false;
+
         while (is_running_ptt && !g_interrupt_received.load()) {
             // Wait for key press (with inactivity timeout in daemon mode)
             while (!ptt.is_key_held() && is_running_ptt && !g_interrupt_received.load()) {
@@ -1001,18 +1019,7 @@ int main(int argc, char ** argv) {
             if (inference_failed) break;
 
             // Apply hallucination filter
-            for (auto& seg : bilingual_results) {
-                if (!seg.original_text.empty())
-                    seg.original_text = filter_hallucinations(seg.original_text);
-                if (!seg.english_text.empty())
-                    seg.english_text = filter_hallucinations(seg.english_text);
-            }
-            bilingual_results.erase(
-                std::remove_if(bilingual_results.begin(), bilingual_results.end(),
-                    [](const BilingualSegment& s) {
-                        return s.original_text.empty() && s.english_text.empty();
-                    }),
-                bilingual_results.end());
+            filter_segment_hallucinations(bilingual_results);
 
             // Silent-drop detection: audio had signal but transcript is empty.
             // Retry once with relaxed no_speech_thold (inspired by Claude Code's
@@ -1043,18 +1050,7 @@ int main(int argc, char ** argv) {
                         std::vector<BilingualSegment> retry_results;
                         if (process_audio_segment(ctx, ctx_translate, retry_params, chunk,
                                                   retry_results, prompt_tokens) == 0) {
-                            for (auto& seg : retry_results) {
-                                if (!seg.original_text.empty())
-                                    seg.original_text = filter_hallucinations(seg.original_text);
-                                if (!seg.english_text.empty())
-                                    seg.english_text = filter_hallucinations(seg.english_text);
-                            }
-                            retry_results.erase(
-                                std::remove_if(retry_results.begin(), retry_results.end(),
-                                    [](const BilingualSegment& s) {
-                                        return s.original_text.empty() && s.english_text.empty();
-                                    }),
-                                retry_results.end());
+                            filter_segment_hallucinations(retry_results);
                             bilingual_results.insert(bilingual_results.end(),
                                                      retry_results.begin(), retry_results.end());
                         }
@@ -1075,16 +1071,16 @@ int main(int argc, char ** argv) {
                 }
                 if (!raw_text.empty()) {
                     std::string refined = refine_transcription(raw_text);
-                    // Replace all segments with a single refined segment
-                    BilingualSegment refined_seg = bilingual_results[0];
+                    // Replace all segments with a single refined segment, reusing
+                    // the first one in place rather than copying it out and back
+                    bilingual_results.erase(bilingual_results.begin() + 1, bilingual_results.end());
+                    BilingualSegment& refined_seg = bilingual_results[0];
                     if (!refined_seg.original_text.empty()) {
                         refined_seg.original_text = " " + refined;
                     } else {
                         refined_seg.english_text = " " + refined;
                     }
                     refined_seg.speaker_turn = false;
-                    bilingual_results.clear();
-                    bilingual_results.push_back(refined_seg);
                 }
             }
 
@@ -1131,11 +1127,13 @@ int main(int argc, char ** argv) {
                     ? auto_copy_session.transcription_buffer.str()
                     : ptt_pipe_text;
                 if (params.history_enabled && !iter_text.empty()) {
-                    HistoryManager history;
-                    if (history.open()) {
+                    if (!ptt_history_open) {
+                        ptt_history_open = ptt_history.open();
+                    }
+                    if (ptt_history_open) {
                         auto now = std::chrono::high_resolution_clock::now();
                         double duration_s = std::chrono::duration<double>(now - t_press).count();
-                        history.save(iter_text, duration_s, params.model, "ptt");
+                        ptt_history.save(iter_text, duration_s, params.model, "ptt");
                     }
                 }
 
@@ -1150,13 +1148,9 @@ int main(int argc, char ** argv) {
 
                 // Signal completion via file + stderr for launcher detection.
                 // File signal is checked first (fast path, no log grep needed).
-                {
-                    std::string done_path = std::string(getenv("HOME") ? getenv("HOME") : "") +
-                                            "/.recognize/claude-session.done";
-                    if (!done_path.empty()) {
-                        std::ofstream done_file(done_path);
-                        if (done_file.is_open()) done_file << "1\n";
-                    }
+                if (!ptt_done_path.empty()) {
+                    std::ofstream done_file(ptt_done_path);
+                    if (done_file.is_open()) done_file << "1\n";
                 }
                 fprintf(stderr, "TRANSCRIPT_DONE\n");
                 fprintf(stderr, "PTT_WAITING\n");
@@ -1215,9 +1209,10 @@ int main(int argc, char ** argv) {
     const auto t_start = t_last;
 
     // Silence timeout state
-    auto t_last_speech = std::chrono::high_resolution_clock::now();
+    auto t_last_speech = t_start;
     bool has_spoken = false;
     const bool silence_timeout_enabled = params.silence_timeout > 0.0f && !params.meeting_mode;
+    const int64_t silence_timeout_ms = static_cast<int64_t>(params.silence_timeout * 1000.0f);
 
     // Main audio processing loop
     while (is_running && !check_interrupt_with_confirmation()) {
@@ -1265,7 +1260,7 @@ int main(int argc, char ** argv) {
                 } else if (has_spoken) {
                     const auto t_silence = std::chrono::duration_cast<std::chrono::milliseconds>(
                         std::chrono::high_resolution_clock::now() - t_last_speech).count();
-                    if (t_silence >= static_cast<int64_t>(params.silence_timeout * 1000.0f)) {
+                    if (t_silence >= silence_timeout_ms) {
                         fprintf(stderr, "[Silence timeout: %.1fs, auto-stopping]\n", params.silence_timeout);
                         is_running = false;
                         break;
@@ -1299,13 +1294,14 @@ int main(int argc, char ** argv) {
                 audio.get(params.length_ms, pcmf32);
                 if (silence_timeout_enabled) {
                     has_spoken = true;
-                    t_last_speech = std::chrono::high_resolution_clock::now();
+                    t_last_speech = t_now;
                 }
             } else {
                 if (silence_timeout_enabled && has_spoken) {
+                    // t_now was read at the top of this poll; reuse it
                     const auto t_silence = std::chrono::duration_cast<std::chrono::milliseconds>(
-                        std::chrono::high_resolution_clock::now() - t_last_speech).count();
-                    if (t_silence >= static_cast<int64_t>(params.silence_timeout * 1000.0f)) {
+                        t_now - t_last_speech).count();
+                    if (t_silence >= silence_timeout_ms) {
                         fprintf(stderr, "[Silence timeout: %.1fs, auto-stopping]\n", params.silence_timeout);
                         is_running = false;
                         break;
@@ -1335,21 +1331,7 @@ int main(int argc, char ** argv) {
             }
 
             // Apply hallucination filter
-            for (auto& seg : bilingual_results) {
-                if (!seg.original_text.empty()) {
-                    seg.original_text = filter_hallucinations(seg.original_text);
-                }
-                if (!seg.english_text.empty()) {
-                    seg.english_text = filter_hallucinations(seg.english_text);
-                }
-            }
-            // Remove segments where both texts became empty after filtering
-            bilingual_results.erase(
-                std::remove_if(bilingual_results.begin(), bilingual_results.end(),
-                    [](const BilingualSegment& s) {
-                        return s.original_text.empty() && s.english_text.empty();
-                    }),
-                bilingual_results.end());
+            filter_segment_hallucinations(bilingual_results);
 
             // Print results
             {
@@ -1488,6 +1470,16 @@ int main(int argc, char ** argv) {
 
     // Refine accumulated text via Claude if enabled (standard mode)
     if (params.refine) {
+        // Refine auto-copy buffer in the background; it is an independent
+        // Claude CLI call, so it need not wait for the pipe refinement
+        std::future<std::string> refined_copy_future;
+        if (params.auto_copy_enabled) {
+            std::string raw_copy = auto_copy_session.transcription_buffer.str();
+            if (!raw_copy.empty()) {
+                refined_copy_future = std::async(std::launch::async,
+                    [raw_copy = std::move(raw_copy)]() { return refine_transcription(raw_copy); });
+            }
+        }
         // Refine pipe output
         std::string raw_pipe = pipe_finalized_text + pipe_current_text.str();
         if (!raw_pipe.empty()) {
@@ -1496,21 +1488,19 @@ int main(int argc, char ** argv) {
             pipe_current_text.str("");
             pipe_current_text.clear();
         }
-        // Refine auto-copy buffer
-        if (params.auto_copy_enabled) {
-            std::string raw_copy = auto_copy_session.transcription_buffer.str();
-            if (!raw_copy.empty()) {
-                std::string refined_copy = refine_transcription(raw_copy);
-                auto_copy_session.transcription_buffer.str("");
-                auto_copy_session.transcription_buffer.clear();
-                auto_copy_session.transcription_buffer << refined_copy;
-            }
+        if (refined_copy_future.valid()) {
+            std::string refined_copy = refined_copy_future.get();
+            auto_copy_session.transcription_buffer.str("");
+            auto_copy_session.transcription_buffer.clear();
+            auto_copy_session.transcription_buffer << refined_copy;
         }
     }
 
-    // Dump accumulated text to stdout when not a TTY (pipe/redirect mode)
+    // Dump accumulated text to stdout when not a TTY (pipe/redirect mode).
+    // The joined text is built once and handed on to history below.
+    std::string final_text;
     if (!stdout_is_tty) {
-        std::string final_text = pipe_finalized_text + pipe_current_text.str();
+        final_text = pipe_finalized_text + pipe_current_text.str();
         if (!final_text.empty()) {
             printf("%s\n", final_text.c_str());
             fflush(stdout);
@@ -1522,7 +1512,7 @@ int main(int argc, char ** argv) {
     if (params.meeting_mode) {
         history_text = meeting_session.get_transcription();
     } else if (!stdout_is_tty) {
-        history_text = pipe_finalized_text + pipe_current_text.str();
+        history_text = std::move(final_text);
     } else {
         history_text = auto_copy_session.transcription_buffer.str();
     }
@@ -64,6 +64,7 @@ void test_filter_typing() {
 void test_filter_url() {
     ASSERT_EQ(filter_hallucinations("www.example.com"), "");
     ASSERT_EQ(filter_hallucinations("https://example.com"), "");
+    ASSERT_EQ(filter_hallucinations("HTTP://Example.com"), "");
 }
 
 void test_filter_real_speech() {
@@ -85,6 +86,12 @@ void test_filter_dedup() {
     ASSERT_TRUE(result.find("Hello. Hello.") == std::string::npos || result.size() < input.size());
 }
 
+void test_filter_dedup_trailing_fragment() {
+    // Two terminators plus an unterminated tail still make three sentences
+    std::string input = "Go on. Go on. Next";
+    ASSERT_TRUE(filter_hallucinations(input).size() < input.size());
+}
+
 // --- count_words tests ---
 
 void test_count_empty() {
@@ -140,6 +147,7 @@ int main() {
     TEST(filter_empty);
     TEST(filter_whitespace_only);
     TEST(filter_dedup);
+    TEST(filter_dedup_trailing_fragment);
 
     TEST(count_empty);
     TEST(count_single);
@@ -1,14 +1,23 @@
 #include "text_processing.h"
 
 #include <algorithm>
+#include <cerrno>
 #include <cstdio>
 #include <cstdlib>
 #include <filesystem>
 #include <fstream>
+#include <mutex>
 #include <sstream>
+#include <unordered_set>
 #include <vector>
+#include <fcntl.h>
+#include <spawn.h>
+#include <sys/stat.h>
+#include <sys/wait.h>
 #include <unistd.h>
 
+extern char** environ;
+
 std::string trim_whitespace(const std::string& str) {
     size_t start = str.find_first_not_of(" \t\n\r\f\v");
     if (start == std::string::npos) {
@@ -18,43 +27,116 @@ std::string trim_whitespace(const std::string& str) {
     return str.substr(start, end - start + 1);
 }
 
+// pipe() with FD_CLOEXEC on both ends. Refinement runs concurrently, so without
+// it each spawned child would inherit the other call's pipe ends and neither
+// parent would see EOF until both children had exited. The file actions'
+// dup2 onto stdin/stdout clears the flag on the child's copy.
+static bool make_cloexec_pipe(int fds[2]) {
+    if (pipe(fds) != 0) {
+        return false;
+    }
+    for (int i = 0; i < 2; ++i) {
+        if (fcntl(fds[i], F_SETFD, FD_CLOEXEC) != 0) {
+            close(fds[0]);
+            close(fds[1]);
+            return false;
+        }
+    }
+    return true;
+}
+
 bool copy_to_clipboard_macos(const std::string& text) {
     if (text.empty()) {
         return false;
     }
 
-    // Use pbcopy on macOS to copy to clipboard
-    FILE* pipe = popen("pbcopy", "w");
-    if (!pipe) {
+    // Use pbcopy on macOS to copy to clipboard. Spawned directly rather than
+    // through popen() so each copy doesn't also pay for a /bin/sh process.
+    int fds[2];
+    if (!make_cloexec_pipe(fds)) {
+        return false;
+    }
+
+    posix_spawn_file_actions_t actions;
+    posix_spawn_file_actions_init(&actions);
+    posix_spawn_file_actions_adddup2(&actions, fds[0], STDIN_FILENO);
+    posix_spawn_file_actions_addclose(&actions, fds[0]);
+    posix_spawn_file_actions_addclose(&actions, fds[1]);
+
+    char* argv[] = {const_cast<char*>("pbcopy"), nullptr};
+    pid_t pid;
+    int spawn_result = posix_spawnp(&pid, "pbcopy", &actions, nullptr, argv, environ);
+    posix_spawn_file_actions_destroy(&actions);
+    close(fds[0]);
+    if (spawn_result != 0) {
+        close(fds[1]);
         return false;
     }
 
-    size_t written = fwrite(text.c_str(), 1, text.length(), pipe);
-    int exit_code = pclose(pipe);
+    size_t written = 0;
+    while (written < text.length()) {
+        ssize_t n = write(fds[1], text.data() + written, text.length() - written);
+        if (n < 0) {
+            if (errno == EINTR) continue;
+            break;
+        }
+        written += static_cast<size_t>(n);
+    }
+    close(fds[1]);
+
+    int status = 0;
+    while (waitpid(pid, &status, 0) < 0 && errno == EINTR) {}
 
-    return (written == text.length() && exit_code == 0);
+    return (written == text.length() && WIFEXITED(status) && WEXITSTATUS(status) == 0);
 }
 
-bool is_claude_cli_available() {
-    // Check if claude command is available in PATH
-    FILE* pipe = popen("which claude 2>/dev/null", "r");
-    if (!pipe) {
-        return false;
+// Absolute path of the claude CLI. The first successful PATH lookup is kept for
+// the life of the process: startup validation, every --refine pass and meeting
+// processing all need it, and invocations then skip the shell's PATH search. A
+// miss is re-checked so a CLI installed while a PTT daemon is running is picked up.
+static std::string claude_cli_path() {
+    static std::mutex path_mutex;
+    static std::string cached_path;
+
+    std::lock_guard<std::mutex> lock(path_mutex);
+    if (!cached_path.empty()) {
+        return cached_path;
+    }
+
+    // Search PATH for an executable claude, the same lookup `which` does,
+    // without forking a shell and which to do it
+    const char* path_env = getenv("PATH");
+    if (!path_env) {
+        return "";
+    }
+
+    const std::string path_list(path_env);
+    size_t start = 0;
+    while (start <= path_list.size()) {
+        size_t end = path_list.find(':', start);
+        if (end == std::string::npos) end = path_list.size();
+
+        std::string candidate = (end > start ? path_list.substr(start, end - start) : ".") + "/claude";
+        struct stat st;
+        if (::stat(candidate.c_str(), &st) == 0 && S_ISREG(st.st_mode) &&
+            access(candidate.c_str(), X_OK) == 0) {
+            cached_path = std::move(candidate);
+            break;
+        }
+        start = end + 1;
     }
 
-    char buffer[256];
-    bool found = (fgets(buffer, sizeof(buffer), pipe) != nullptr);
-    pclose(pipe);
+    return cached_path;
+}
 
-    return found;
+bool is_claude_cli_available() {
+    return !claude_cli_path().empty();
 }
 
 // Filter common whisper hallucination patterns from transcribed text
 std::string filter_hallucinations(const std::string& text) {
     if (text.empty()) return text;
 
-    std::string filtered = text;
-
     // Known phantom phrases that whisper hallucinates on silence/noise
     static const std::vector<std::string> phantom_patterns = {
         "Thank you for watching",
@@ -99,56 +181,68 @@ std::string filter_hallucinations(const std::string& text) {
     };
 
     // Trim whitespace first
-    std::string trimmed = filtered;
-    size_t start = trimmed.find_first_not_of(" \t\n\r");
+    size_t start = text.find_first_not_of(" \t\n\r");
     if (start == std::string::npos) return "";
-    size_t end = trimmed.find_last_not_of(" \t\n\r");
-    trimmed = trimmed.substr(start, end - start + 1);
+    size_t end = text.find_last_not_of(" \t\n\r");
 
-    // Check if entire text is a single phantom phrase (case-insensitive)
+    // Check if entire text is a single phantom phrase (case-insensitive).
+    // The trimmed range is lowercased straight into its own buffer: one copy.
     auto to_lower = [](unsigned char c) -> char { return std::tolower(c); };
-    std::string lower_trimmed = trimmed;
-    std::transform(lower_trimmed.begin(), lower_trimmed.end(), lower_trimmed.begin(), to_lower);
+    std::string lower_trimmed(end - start + 1, '\0');
+    std::transform(text.begin() + start, text.begin() + end + 1, lower_trimmed.begin(), to_lower);
+
+    // Patterns are lowercased once into a hash set, so a whole-text match is
+    // a single lookup rather than a comparison against every pattern
+    static const std::unordered_set<std::string> lower_phantom_patterns = [&]() {
+        std::unordered_set<std::string> lowered;
+        lowered.reserve(phantom_patterns.size());
+        for (const auto& pattern : phantom_patterns) {
+            std::string lower_pattern = pattern;
+            std::transform(lower_pattern.begin(), lower_pattern.end(), lower_pattern.begin(), to_lower);
+            lowered.insert(std::move(lower_pattern));
+        }
+        return lowered;
+    }();
+    static const char* const url_prefixes[] = {"www.", "http://", "https://"};
 
-    for (const auto& pattern : phantom_patterns) {
-        std::string lower_pattern = pattern;
-        std::transform(lower_pattern.begin(), lower_pattern.end(), lower_pattern.begin(), to_lower);
+    // If entire trimmed text matches a phantom pattern, filter it out
+    if (lower_phantom_patterns.count(lower_trimmed) != 0) {
+        return "";
+    }
 
-        // If entire trimmed text matches a phantom pattern, filter it out
-        if (lower_trimmed == lower_pattern) {
+    // If text starts with a URL pattern, filter it
+    for (const char* prefix : url_prefixes) {
+        if (lower_trimmed.rfind(prefix, 0) == 0) {
             return "";
         }
+    }
 
-        // If text starts with a URL pattern, filter it
-        if ((pattern == "www." || pattern == "http://" || pattern == "https://") &&
-            lower_trimmed.find(lower_pattern) == 0) {
-            return "";
-        }
+    // Deduplicate consecutive identical sentences (requires 3+ sentences total).
+    // Three sentences need at least two terminators, so short segments skip the split.
+    size_t terminators = std::count_if(text.begin(), text.end(),
+                                       [](char c) { return c == '.' || c == '!' || c == '?'; });
+    if (terminators < 2) {
+        return text;
     }
 
-    // Deduplicate consecutive identical sentences (requires 3+ sentences total)
-    // Split by sentence-ending punctuation
+    // Split by sentence-ending punctuation in one pass, slicing each sentence
+    // (without its leading whitespace) straight out of the text
     std::vector<std::string> sentences;
-    std::string current;
-    for (char c : filtered) {
-        current += c;
+    sentences.reserve(terminators + 1);
+    size_t sentence_start = 0;
+    for (size_t i = 0; i < text.size(); ++i) {
+        char c = text[i];
         if (c == '.' || c == '!' || c == '?') {
-            std::string s = current;
-            size_t s_start = s.find_first_not_of(" \t\n\r");
-            if (s_start != std::string::npos) {
-                s = s.substr(s_start);
-            }
-            if (!s.empty()) {
-                sentences.push_back(s);
-            }
-            current.clear();
+            // Never npos: the terminator itself is not whitespace
+            size_t s_start = text.find_first_not_of(" \t\n\r", sentence_start);
+            sentences.emplace_back(text, s_start, i + 1 - s_start);
+            sentence_start = i + 1;
         }
     }
-    if (!current.empty()) {
-        std::string s = current;
-        size_t s_start = s.find_first_not_of(" \t\n\r");
+    if (sentence_start < text.size()) {
+        size_t s_start = text.find_first_not_of(" \t\n\r", sentence_start);
         if (s_start != std::string::npos) {
-            sentences.push_back(s.substr(s_start));
+            sentences.emplace_back(text, s_start);
         }
     }
 
@@ -171,7 +265,7 @@ std::string filter_hallucinations(const std::string& text) {
         }
     }
 
-    return filtered;
+    return text;
 }
 
 // Count words in a string
@@ -245,26 +339,62 @@ std::string invoke_claude_cli(const std::string& prompt_text, int timeout_second
 
     // Pipe prompt into claude CLI
     (void)timeout_seconds; // timeout handled by claude CLI itself
-    std::ostringstream cmd;
-    cmd << "cat '" << temp_path_str << "' | claude -p - 2>/dev/null";
+    std::string claude_path = claude_cli_path();
+    if (claude_path.empty()) {
+        std::filesystem::remove(temp_path_str);
+        return "";
+    }
 
-    FILE* pipe = popen(cmd.str().c_str(), "r");
-    if (!pipe) {
+    // Spawn claude directly with the prompt file as its stdin and stdout on a
+    // pipe, rather than popen()ing a shell that runs cat into it.
+    int fds[2];
+    if (!make_cloexec_pipe(fds)) {
         std::filesystem::remove(temp_path_str);
         return "";
     }
 
-    std::ostringstream output;
-    char buffer[4096];
-    while (fgets(buffer, sizeof(buffer), pipe) != nullptr) {
-        output << buffer;
+    posix_spawn_file_actions_t actions;
+    posix_spawn_file_actions_init(&actions);
+    posix_spawn_file_actions_addopen(&actions, STDIN_FILENO, temp_path_str.c_str(), O_RDONLY, 0);
+    posix_spawn_file_actions_adddup2(&actions, fds[1], STDOUT_FILENO);
+    posix_spawn_file_actions_addopen(&actions, STDERR_FILENO, "/dev/null", O_WRONLY, 0);
+    posix_spawn_file_actions_addclose(&actions, fds[0]);
+    posix_spawn_file_actions_addclose(&actions, fds[1]);
+
+    char* argv[] = {const_cast<char*>(claude_path.c_str()), const_cast<char*>("-p"),
+                    const_cast<char*>("-"), nullptr};
+    pid_t pid;
+    int spawn_result = posix_spawn(&pid, claude_path.c_str(), &actions, nullptr, argv, environ);
+    posix_spawn_file_actions_destroy(&actions);
+    close(fds[1]);
+    if (spawn_result != 0) {
+        close(fds[0]);
+        std::filesystem::remove(temp_path_str);
+        return "";
+    }
+
+    // Drain the response in large blocks rather than line by line, so a long
+    // meeting summary is copied out of the pipe in a few reads and claude never
+    // stalls on a full pipe.
+    std::string output;
+    char buffer[65536];
+    for (;;) {
+        ssize_t n = read(fds[0], buffer, sizeof(buffer));
+        if (n < 0) {
+            if (errno == EINTR) continue;
+            break;
+        }
+        if (n == 0) break;
+        output.append(buffer, static_cast<size_t>(n));
     }
+    close(fds[0]);
 
-    int exit_code = pclose(pipe);
+    int status = 0;
+    while (waitpid(pid, &status, 0) < 0 && errno == EINTR) {}
     std::filesystem::remove(temp_path_str);
 
-    if (exit_code != 0) return "";
-    return output.str();
+    if (!WIFEXITED(status) || WEXITSTATUS(status) != 0) return "";
+    return output;
 }
 
 // ASR refinement prompt — informed by research on LLM-based generative error